@@ -14,8 +14,7 @@ try:
     from dolfinx import mesh, fem
     from dolfinx.fem import petsc
     import ufl
-    import numpy as np
-except Exception as exc:  # pragma: no cover - optional dependencies
+except Exception:  # pragma: no cover - optional dependencies
     pytest.skip("FEniCSx not available", allow_module_level=True)
 
 
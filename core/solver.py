@@ -1,8 +1,29 @@
 """Numerical solvers for data processing routines."""
 
+from functools import lru_cache
+
 import numpy as np
-from scipy import stats
-from scipy.signal import savgol_filter
+from scipy.ndimage import correlate1d
+from scipy.signal import savgol_coeffs, savgol_filter
+
+
+@lru_cache(maxsize=32)
+def _sg_fit_matrix(window_length: int, polyorder: int) -> np.ndarray:
+    """Return the ``(window, window)`` Savitzky–Golay evaluation matrix.
+
+    Row ``i`` evaluates the least-squares polynomial of a window at offset
+    ``i``: the middle row is the usual smoothing kernel and the others give
+    the ``mode="interp"`` edge values. Cached (read-only) so repeated calls
+    with the same parameters skip the least-squares solves.
+    """
+    matrix = np.stack(
+        [
+            savgol_coeffs(window_length, polyorder, pos=pos, use="dot")
+            for pos in range(window_length)
+        ]
+    )
+    matrix.setflags(write=False)
+    return matrix
 
 
 def apply_savitzky_golay_filter(
@@ -24,7 +45,20 @@ def apply_savitzky_golay_filter(
     np.ndarray
         Smoothed array with same shape as ``data_array``.
     """
-    return savgol_filter(data_array, window_length=window_length, polyorder=polyorder)
+    data = np.asarray(data_array, dtype=float)
+    if data.ndim != 1 or window_length % 2 == 0 or data.size < window_length:
+        # Let scipy validate (and report) anything outside the fast path.
+        return savgol_filter(data_array, window_length=window_length, polyorder=polyorder)
+
+    matrix = _sg_fit_matrix(window_length, polyorder)
+    half = window_length // 2
+    filtered = correlate1d(data, matrix[half], mode="constant")
+    # Same edge treatment as ``savgol_filter(mode="interp")``: the first and
+    # last ``half`` points come from the polynomial fitted to the end windows.
+    if half:
+        filtered[:half] = matrix[:half] @ data[:window_length]
+        filtered[-half:] = matrix[half + 1:] @ data[-window_length:]
+    return filtered
 
 
 def calculate_activation_energy(
@@ -51,13 +85,28 @@ def calculate_activation_energy(
     inv_T = 1.0 / temperatures.astype(float)
     ln_rate = np.log(rates.astype(float))
 
-    regression = stats.linregress(inv_T, ln_rate)
-    r_squared = regression.rvalue**2
-    Q = -regression.slope * 8.314 / 1000.0
+    # Closed-form two-parameter least squares on centred data, which is what
+    # ``linregress`` computes, without its extra statistics.
+    n = inv_T.size
+    mean_x = inv_T.sum() / n
+    mean_y = ln_rate.sum() / n
+    dx = inv_T - mean_x
+    dy = ln_rate - mean_y
+    sxx = np.dot(dx, dx)
+    syy = np.dot(dy, dy)
+    sxy = np.dot(dx, dy)
+    if sxx == 0:
+        raise ValueError("all temperatures are identical")
+    slope = sxy / sxx
+    intercept = mean_y - slope * mean_x
+    # Rounding can push r**2 just past 1 on exact data; ``linregress`` clips
+    # r to [-1, 1] for the same reason.
+    r_squared = min(1.0, sxy * sxy / (sxx * syy)) if syy > 0 else 0.0
+    Q = -slope * 8.314 / 1000.0
 
     return {
         "Q": Q,
         "r_squared": r_squared,
-        "slope": regression.slope,
-        "intercept": regression.intercept,
+        "slope": slope,
+        "intercept": intercept,
     }
@@ -7,29 +7,85 @@ try:  # retrieving distribution version
 except PackageNotFoundError:  # running in editable mode
     __version__ = "0.dev0"
 
-from .core import (
-    R,
-    SinteringDataRecord,
-    DataHistory,
-    add_suffix_once,
-    criar_titulo,
-    exibir_mensagem,
-    exibir_erro,
-    gerar_link_download,
-    boltzmann_sigmoid,
-    generalized_logistic_stable,
-    SOVSSolver,
-)
-from .utils import normalize_columns, orlandini_araujo_filter, savgol_filter
-from .plotting import plot_sintering_curves
-from .processing import calculate_log_theta
-from .master_curve import build_master_curve
-from .material_calibrator import MaterialCalibrator
-from .stats import bootstrap_ea, shapiro_residuals, generate_report
-from .final_report import FinalReportModule
-from .mesh_generator import generate_mesh
-from .mesh_generator_ui import MeshGeneratorUI
-from .data_refinement import DataRefinement
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+# Public names are resolved from their submodule on first access, so
+# ``import ogum.stats`` (or the API app) does not pull in pyplot, ipywidgets
+# and the other UI dependencies of unrelated modules.
+_LAZY_ATTRS = {
+    "R": "core",
+    "SinteringDataRecord": "core",
+    "DataHistory": "core",
+    "add_suffix_once": "core",
+    "criar_titulo": "core",
+    "exibir_mensagem": "core",
+    "exibir_erro": "core",
+    "gerar_link_download": "core",
+    "boltzmann_sigmoid": "core",
+    "generalized_logistic_stable": "core",
+    "SOVSSolver": "core",
+    "normalize_columns": "utils",
+    "orlandini_araujo_filter": "utils",
+    "savgol_filter": "utils",
+    "plot_sintering_curves": "plotting",
+    "calculate_log_theta": "processing",
+    "calculate_log_theta_arrays": "processing",
+    "build_master_curve": "master_curve",
+    "MaterialCalibrator": "material_calibrator",
+    "bootstrap_ea": "stats",
+    "shapiro_residuals": "stats",
+    "generate_report": "stats",
+    "FinalReportModule": "final_report",
+    "generate_mesh": "mesh_generator",
+    "MeshGeneratorUI": "mesh_generator_ui",
+    "DataRefinement": "data_refinement",
+}
+
+
+# Submodules that used to be bound by the eager imports (``ogum.stats``...).
+_SUBMODULES = frozenset(_LAZY_ATTRS.values()) | {"accel", "sovs"}
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return import_module(f".{name}", __name__)
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY_ATTRS, *_SUBMODULES})
+
+
+if TYPE_CHECKING:  # pragma: no cover - static analysers see the real names
+    from .core import (
+        R,
+        SinteringDataRecord,
+        DataHistory,
+        add_suffix_once,
+        criar_titulo,
+        exibir_mensagem,
+        exibir_erro,
+        gerar_link_download,
+        boltzmann_sigmoid,
+        generalized_logistic_stable,
+        SOVSSolver,
+    )
+    from .utils import normalize_columns, orlandini_araujo_filter, savgol_filter
+    from .plotting import plot_sintering_curves
+    from .processing import calculate_log_theta, calculate_log_theta_arrays
+    from .master_curve import build_master_curve
+    from .material_calibrator import MaterialCalibrator
+    from .stats import bootstrap_ea, shapiro_residuals, generate_report
+    from .final_report import FinalReportModule
+    from .mesh_generator import generate_mesh
+    from .mesh_generator_ui import MeshGeneratorUI
+    from .data_refinement import DataRefinement
 
 __all__ = [
     "R",
@@ -47,6 +103,7 @@ __all__ = [
     "orlandini_araujo_filter",
     "savgol_filter",
     "calculate_log_theta",
+    "calculate_log_theta_arrays",
     "build_master_curve",
     "MaterialCalibrator",
     "plot_sintering_curves",
@@ -0,0 +1,47 @@
+"""Optional acceleration backends for the numerical kernels.
+
+Numba and numexpr are optional dependencies.  Modules import them from here
+and check :data:`HAS_NUMBA` / :data:`HAS_NUMEXPR` to choose between an
+accelerated kernel and the plain NumPy implementation.
+"""
+
+from __future__ import annotations
+
+try:
+    from numba import njit, vectorize
+except ImportError:  # pragma: no cover - optional dependency
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):  # type: ignore
+        """Return the decorated function unchanged (interpreted fallback)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    def vectorize(*args, **kwargs):  # type: ignore
+        """Raise an error indicating the missing optional dependency."""
+        raise RuntimeError("numba is required for compiled kernels")
+
+else:
+    HAS_NUMBA = True
+
+try:
+    import numexpr as ne
+except ImportError:  # pragma: no cover - optional dependency
+    ne = None
+    HAS_NUMEXPR = False
+else:
+    HAS_NUMEXPR = True
+
+#: Below this many elements numexpr's dispatch costs more than it saves.
+NUMEXPR_MIN_SIZE = 10_000
+
+
+__all__ = [
+    "HAS_NUMBA",
+    "HAS_NUMEXPR",
+    "NUMEXPR_MIN_SIZE",
+    "ne",
+    "njit",
+    "vectorize",
+]
@@ -7,10 +7,9 @@ from typing import Optional
 
 from fastapi import APIRouter
 from pydantic import BaseModel
-import pandas as pd
 import numpy as np
 
-from ogum.processing import calculate_log_theta
+from ogum.processing import calculate_log_theta_arrays
 from ogum.fem_interface import create_unit_mesh, densify_mesh
 
 router = APIRouter()
@@ -45,19 +44,17 @@ class FEMInput(BaseModel):
 @router.post("/calc-master", response_model=MasterOutput, tags=["Master"])
 def calc_master(input: MasterInput) -> dict:
     """Calculate the master curve for a sintering experiment."""
-    df = pd.DataFrame(
-        {
-            "Time_s": input.time_s,
-            "Temperature_C": input.temperature_c,
-            "DensidadePct": input.density_pct,
-        }
+    logtheta, valor, tempo_s = calculate_log_theta_arrays(
+        np.asarray(input.time_s, dtype=np.float64),
+        np.asarray(input.temperature_c, dtype=np.float64),
+        np.asarray(input.density_pct, dtype=np.float64),
+        input.energia_ativacao_kj,
     )
-    df_out = calculate_log_theta(df, energia_ativacao_kj=input.energia_ativacao_kj)
-    logtheta_list = [None if np.isnan(v) else v for v in df_out["logtheta"]]
+    logtheta_list = [None if np.isnan(v) else v for v in logtheta.tolist()]
     return {
         "logtheta": logtheta_list,
-        "valor": df_out["valor"].tolist(),
-        "tempo_s": df_out["tempo_s"].tolist(),
+        "valor": valor.tolist(),
+        "tempo_s": tempo_s.tolist(),
     }
 
 
@@ -65,7 +62,8 @@ def calc_master(input: MasterInput) -> dict:
 def fem_sim(input: FEMInput) -> dict[str, list[float]]:
     """Run a simple FEM densification simulation."""
     mesh = create_unit_mesh(input.mesh_size)
-    densities = densify_mesh(mesh, input.history, Ea=input.Ea, A=input.A)
+    history = np.asarray(input.history, dtype=np.float64)
+    densities = densify_mesh(mesh, history, Ea=input.Ea, A=input.A)
     return {"densities": densities.tolist()}
 
 
@@ -5,11 +5,16 @@ from __future__ import annotations
 
 import base64
 import datetime
+import math
+import threading
+from collections import deque
 from dataclasses import dataclass, field
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional
 
+from .accel import HAS_NUMBA, vectorize
 from .utils import normalize_columns
 from .sovs import SOVSSolver
 
@@ -17,27 +22,9 @@ import numpy as np
 import pandas as pd
 from scipy.integrate import cumulative_trapezoid as cumtrapz
 
-try:
-    from IPython.display import HTML, display
+if TYPE_CHECKING:  # pragma: no cover - annotations only
     import ipywidgets as widgets
-except Exception:  # pragma: no cover - optional dependency
-
-    class _Dummy:
-        """Fallback widget used when ``ipywidgets`` is unavailable."""
-
-        def __getattr__(self, name):
-            """Raise an error indicating the missing optional dependency."""
-            raise RuntimeError("ipywidgets is required for GUI functions")
-
-    widgets = _Dummy()
-
-    def display(*args, **kwargs):  # type: ignore
-        """Stub ``display`` when running without IPython."""
-        pass
-
-    def HTML(text):  # type: ignore
-        """Return ``text`` unchanged as a minimal HTML stub."""
-        return text
+    from IPython.display import HTML
 
 
 R = 8.314  # Constante universal dos gases (J/mol.K)
@@ -54,12 +41,26 @@ class SinteringDataRecord:
     metadata: dict = field(default_factory=dict)
 
 
+def _copy_on_write() -> bool:
+    """Return whether pandas copy-on-write is in effect (always from 3.0)."""
+    if int(pd.__version__.split(".", 1)[0]) >= 3:
+        return True
+    try:
+        return pd.get_option("mode.copy_on_write") is True
+    except KeyError:  # pragma: no cover - pandas < 1.5
+        return False
+
+
 class DataHistory:
-    """Armazena versões de DataFrames para permitir desfazer operações."""
+    """Armazena versões de DataFrames para permitir desfazer operações.
 
-    def __init__(self) -> None:
-        """Initialize an empty history list."""
-        self.history: List[Dict[str, Any]] = []
+    Apenas as ``maxlen`` versões mais recentes são mantidas (``None`` para
+    não limitar); ao exceder o limite a mais antiga é descartada.
+    """
+
+    def __init__(self, maxlen: Optional[int] = 50) -> None:
+        """Initialize an empty, optionally bounded, history."""
+        self.history: Deque[Dict[str, Any]] = deque(maxlen=maxlen)
 
     def push(self, data: pd.DataFrame, module_name: str) -> None:
         """Store a snapshot of ``data`` with metadata.
@@ -68,11 +69,13 @@ class DataHistory:
             data (pd.DataFrame): DataFrame to be stored.
             module_name (str): Name of the module originating the data.
         """
+        # Com copy-on-write uma cópia rasa já é um snapshot: os dados só
+        # são duplicados se o original for modificado depois.
         record = {
             "timestamp": datetime.datetime.now(),
             "module": module_name,
             "columns": list(data.columns),
-            "data": data.copy(deep=True),
+            "data": data.copy(deep=not _copy_on_write()),
         }
         self.history.append(record)
 
@@ -108,13 +111,48 @@ class DataHistory:
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=1024)
 def add_suffix_once(col: str, suffix: str) -> str:
-    """Return ``col`` with ``suffix`` appended only once."""
+    """Return ``col`` with ``suffix`` appended only once.
+
+    Memoised: column renames repeat the same few names across ensaios.
+    """
     return col if col.endswith(suffix) else f"{col}{suffix}"
 
 
+# ``ipywidgets`` and ``IPython`` are only needed by the notebook helpers below,
+# so they are imported on first use to keep numeric and API imports light.
+
+
+def _import_widgets():
+    """Return the ``ipywidgets`` module or raise if it is unavailable."""
+    try:
+        import ipywidgets as widgets
+    except Exception as exc:  # pragma: no cover - optional dependency
+        raise RuntimeError("ipywidgets is required for GUI functions") from exc
+    return widgets
+
+
+def _import_display():
+    """Return ``(HTML, display)`` from IPython or minimal stand-ins."""
+    try:
+        from IPython.display import HTML, display
+    except Exception:  # pragma: no cover - optional dependency
+
+        def display(*args, **kwargs):
+            """Stub ``display`` when running without IPython."""
+            pass
+
+        def HTML(text):
+            """Return ``text`` unchanged as a minimal HTML stub."""
+            return text
+
+    return HTML, display
+
+
 def criar_titulo(texto: str, nivel: int = 2) -> widgets.HTML:
     """Return an HTML widget used as a section title."""
+    widgets = _import_widgets()
     return widgets.HTML(f"<h{nivel}>{texto}</h{nivel}>")
 
 
@@ -128,6 +166,7 @@ def exibir_mensagem(msg: str, log_widget: widgets.Output | None = None) -> None:
     log_widget : widgets.Output, optional
         If provided, the HTML message is printed inside this widget.
     """
+    HTML, display = _import_display()
     html = HTML(f"<p style='color:blue; font-style:italic;'>{msg}</p>")
     if log_widget:
         with log_widget:
@@ -146,6 +185,7 @@ def exibir_erro(msg: str, log_widget: widgets.Output | None = None) -> None:
     log_widget : widgets.Output, optional
         If provided, the HTML message is printed inside this widget.
     """
+    HTML, display = _import_display()
     html = HTML(f"<p style='color:red; font-weight:bold;'>ERRO: {msg}</p>")
     if log_widget:
         with log_widget:
@@ -154,15 +194,30 @@ def exibir_erro(msg: str, log_widget: widgets.Output | None = None) -> None:
         display(html)
 
 
+_tls = threading.local()
+
+
+def _get_buffer() -> BytesIO:
+    """Return this thread's reusable export buffer, emptied."""
+    buf = getattr(_tls, "buf", None)
+    if buf is None:
+        buf = BytesIO()
+        _tls.buf = buf
+    buf.seek(0)
+    buf.truncate(0)
+    return buf
+
+
 def gerar_link_download(df: pd.DataFrame, nome_arquivo: str = "dados.xlsx") -> HTML:
     """Gera link HTML para baixar ``df`` como arquivo Excel."""
+    HTML, _ = _import_display()
     uid = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
     stem = Path(nome_arquivo).stem
     final_name = f"{stem}_{uid}.xlsx"
-    output = BytesIO()
+    output = _get_buffer()
     with pd.ExcelWriter(output, engine="openpyxl") as writer:
         df.to_excel(writer, index=False)
-    b64 = base64.b64encode(output.getvalue()).decode()
+    b64 = base64.b64encode(output.getbuffer()).decode("ascii")
     return HTML(
         f'<a download="{final_name}" '
         f'href="data:application/vnd.openxmlformats-officedocument.spreadsheetml.sheet;base64,{b64}" '
@@ -188,6 +243,8 @@ def boltzmann_sigmoid(x, A1, A2, x0, dx):
     Returns:
         np.ndarray: Evaluated sigmoid values.
     """
+    if HAS_NUMBA:
+        return _boltzmann_sigmoid_ufunc(x, A1, A2, x0, dx)
     exp_term = np.exp(np.clip((x - x0) / dx, -700, 700))
     return A2 + (A1 - A2) / (1 + exp_term)
 
@@ -206,12 +263,39 @@ def generalized_logistic_stable(x, A1, A2, x0, b, c):
     Returns:
         np.ndarray: Evaluated logistic values.
     """
+    if HAS_NUMBA:
+        return _generalized_logistic_ufunc(x, A1, A2, x0, b, c)
     z = -(x - x0) / b
     log_1_plus_exp_z = np.where(z > 30, z, np.log1p(np.exp(z)))
     denominator = np.exp(c * log_1_plus_exp_z)
     return A2 + (A1 - A2) / (denominator + 1e-12)
 
 
+if HAS_NUMBA:
+    # Element-wise kernels compiled to a single fused loop; they mirror the
+    # NumPy expressions above without allocating the intermediate arrays.
+    # No signatures are given, so compilation happens on first call instead
+    # of at import time.
+
+    @vectorize(cache=True)
+    def _boltzmann_sigmoid_ufunc(x, A1, A2, x0, dx):  # pragma: no cover - jit
+        z = (x - x0) / dx
+        if z > 700.0:
+            z = 700.0
+        elif z < -700.0:
+            z = -700.0
+        return A2 + (A1 - A2) / (1.0 + math.exp(z))
+
+    @vectorize(cache=True)
+    def _generalized_logistic_ufunc(x, A1, A2, x0, b, c):  # pragma: no cover
+        z = -(x - x0) / b
+        if z > 30.0:
+            log_1_plus_exp_z = z
+        else:
+            log_1_plus_exp_z = math.log1p(math.exp(z))
+        return A2 + (A1 - A2) / (math.exp(c * log_1_plus_exp_z) + 1e-12)
+
+
 __all__ = [
     "R",
     "SinteringDataRecord",
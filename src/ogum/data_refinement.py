@@ -2,26 +2,24 @@
 
 from __future__ import annotations
 
+import threading
 from typing import Sequence
 
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
 try:
-    from IPython.display import display, clear_output
+    from IPython.display import display
     import ipywidgets as widgets
 except Exception:  # pragma: no cover - optional dependency
-    class _Dummy:
-        def __getattr__(self, name):
-            raise RuntimeError("ipywidgets is required for GUI functions")
-
-    widgets = _Dummy()  # type: ignore
+    _HAVE_WIDGETS = False
 
     def display(*args, **kwargs):  # type: ignore
         pass
 
-    def clear_output(*args, **kwargs):  # type: ignore
-        pass
+else:
+    _HAVE_WIDGETS = True
 
 
 class DataRefinement:
@@ -30,9 +28,19 @@ class DataRefinement:
     df_original: pd.DataFrame
     df_refined: pd.DataFrame
 
+    #: Quiet period (s) after the last slider event before the table redraws.
+    debounce_s = 0.15
+
     def __init__(self, df_mapped: pd.DataFrame) -> None:
         """Store ``df_mapped`` and create filtering widgets."""
+        if not _HAVE_WIDGETS:
+            raise RuntimeError("ipywidgets is required for GUI functions")
         self.df_original = df_mapped.copy()
+        # Column arrays reused by every slider update.
+        self._time = self.df_original["time"].to_numpy()
+        self._density = self.df_original["density"].to_numpy()
+        self._time_sorted = bool(np.all(self._time[1:] >= self._time[:-1]))
+        self._redraw_timer: threading.Timer | None = None
         self._build_widgets()
         self.df_refined = self._apply_filters()
 
@@ -41,14 +49,15 @@ class DataRefinement:
         t_max = float(self.df_original["time"].max())
         d_min = float(self.df_original["density"].min())
         d_max = float(self.df_original["density"].max())
-        self.time_slider = widgets.FloatRangeSlider(
+        FloatRangeSlider = widgets.FloatRangeSlider
+        self.time_slider = FloatRangeSlider(
             value=(t_min, t_max),
             min=t_min,
             max=t_max,
             step=(t_max - t_min) / 100 or 1.0,
             description="tempo",
         )
-        self.density_slider = widgets.FloatRangeSlider(
+        self.density_slider = FloatRangeSlider(
             value=(d_min, d_max),
             min=d_min,
             max=d_max,
@@ -69,19 +78,37 @@ class DataRefinement:
     def _apply_filters(self) -> pd.DataFrame:
         t_min, t_max = self.time_slider.value
         d_min, d_max = self.density_slider.value
-        mask = (
-            (self.df_original["time"] >= t_min)
-            & (self.df_original["time"] <= t_max)
-            & (self.df_original["density"] >= d_min)
-            & (self.df_original["density"] <= d_max)
-        )
-        return self.df_original.loc[mask].reset_index(drop=True)
+        if self._time_sorted:
+            # Time is monotonic: locate the window by bisection and only
+            # test the density bounds inside it.
+            i0 = np.searchsorted(self._time, t_min, side="left")
+            i1 = np.searchsorted(self._time, t_max, side="right")
+            dens = self._density[i0:i1]
+            rows = i0 + np.flatnonzero((dens >= d_min) & (dens <= d_max))
+        else:
+            rows = np.flatnonzero(
+                (self._time >= t_min)
+                & (self._time <= t_max)
+                & (self._density >= d_min)
+                & (self._density <= d_max)
+            )
+        return self.df_original.iloc[rows].reset_index(drop=True)
 
     def _update(self, _=None) -> None:
+        # Filtering is cheap and keeps ``df_refined`` current; rendering the
+        # table is not, so it is deferred until a slider drag settles.
         self.df_refined = self._apply_filters()
-        with self.output:
-            clear_output(wait=True)
-            display(self.df_refined)
+        if self._redraw_timer is not None:
+            self._redraw_timer.cancel()
+        self._redraw_timer = threading.Timer(self.debounce_s, self._redraw)
+        self._redraw_timer.daemon = True
+        self._redraw_timer.start()
+
+    def _redraw(self) -> None:
+        self._redraw_timer = None
+        # Thread-safe Output API (the context manager is not, off the kernel thread).
+        self.output.clear_output(wait=True)
+        self.output.append_display_data(self.df_refined)
 
     def plot_before_after(self) -> tuple[plt.Figure, Sequence[plt.Axes]]:
         """Return figure with original and filtered curves side by side."""
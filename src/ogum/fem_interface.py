@@ -1,7 +1,10 @@
 """Interface utilities for running finite element simulations."""
 
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any, Callable, List, Tuple
-from threading import Thread
+from threading import Lock
 import numpy as np
 
 
@@ -18,49 +21,133 @@ def create_unit_mesh(mesh_size: float) -> Any:
     return mesh
 
 
+@lru_cache(maxsize=32)
+def _parse_history(key: tuple) -> np.ndarray:
+    """Convert a hashable history to a read-only float array (memoized)."""
+    hist = np.asarray(key, dtype=float)
+    hist.setflags(write=False)
+    return hist
+
+
+def _history_array(temperature_history) -> np.ndarray:
+    """Return ``temperature_history`` as a float array.
+
+    Arrays pass through without copying; lists of ``(tempo, T)`` pairs are
+    parsed once and reused, so parameter sweeps over ``Ea``/``A`` with a
+    fixed history do not convert it again on every call.
+    """
+    if isinstance(temperature_history, np.ndarray):
+        return np.asarray(temperature_history, dtype=float)
+    try:
+        return _parse_history(tuple(map(tuple, temperature_history)))
+    except TypeError:  # nested lists (per-cell histories) are not hashable
+        return np.asarray(temperature_history, dtype=float)
+
+
+def _solve_one(args: tuple) -> float:
+    """Integrate one cell history and return its final density.
+
+    Defined at module level so it can be pickled by the process pool.
+    """
+    from ogum.sovs import SOVSSolver
+    times, temps_k, Ea, A, solver_options = args
+    solver = SOVSSolver(Ea=Ea, A=A, **(solver_options or {}))
+    return float(solver.solve(times, temps_k)[-1])
+
+
 def densify_mesh(
     mesh,
-    temperature_history: List[Tuple[float, float]],
+    temperature_history: List[Tuple[float, float]] | np.ndarray,
     Ea: float,
     A: float,
     solver_options: dict | None = None,
+    max_workers: int | None = 1,
 ) -> np.ndarray:
-    """Resolve a densificação via ``SOVSSolver`` em cada célula da malha."""
+    """Resolve a densificação via ``SOVSSolver`` em cada célula da malha.
+
+    ``temperature_history`` pode ser uma lista de pares ``(tempo, T[°C])`` ou
+    um array ``(N, 2)`` com as mesmas colunas, aplicado a todas as células.
+    Um array ``(num_cells, N, 2)`` define um histórico por célula. Por padrão
+    (``max_workers=1``) as integrações rodam neste processo; com
+    ``max_workers=N`` (ou ``None`` para ``os.cpu_count()``) elas são
+    distribuídas num pool de processos, o que exige que o script chamador
+    seja importável (guarda ``if __name__ == "__main__"`` no método *spawn*).
+    """
     from ogum.sovs import SOVSSolver
-    times, temps_c = zip(*temperature_history)
-    temps_k = np.array(temps_c, dtype=float) + 273.15
-    times_arr = np.asarray(times, dtype=float)
-    solver = SOVSSolver(Ea=Ea, A=A, **(solver_options or {}))
+    hist = _history_array(temperature_history)
+    if hist.ndim not in (2, 3) or hist.shape[-1] != 2:
+        raise ValueError(
+            "temperature_history must have shape (N, 2) or (num_cells, N, 2)"
+        )
     num_cells = mesh.topology.index_map(mesh.topology.dim).size_local
-    densities = np.empty(num_cells)
-    for i in range(num_cells):
-        rho = solver.solve(times_arr, temps_k)
-        densities[i] = rho[-1]
-    return np.array(densities)
+
+    if hist.ndim == 3:
+        if hist.shape[0] != num_cells:
+            raise ValueError("One temperature history is required per cell")
+        args = [
+            (cell[:, 0], cell[:, 1] + 273.15, Ea, A, solver_options)
+            for cell in hist
+        ]
+        workers = max_workers if max_workers is not None else os.cpu_count() or 1
+        if workers == 1 or num_cells < 2:
+            return np.array([_solve_one(a) for a in args], dtype=float)
+        chunksize = max(1, num_cells // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_solve_one, args, chunksize=chunksize)
+            return np.fromiter(results, dtype=float, count=num_cells)
+
+    times_arr = hist[:, 0]
+    temps_k = hist[:, 1] + 273.15
+    solver = SOVSSolver(Ea=Ea, A=A, **(solver_options or {}))
+    # Every cell sees the same thermal history, so one integration suffices.
+    rho_final = float(solver.solve(times_arr, temps_k)[-1])
+    return np.full(num_cells, rho_final, dtype=float)
+
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared executor used by :func:`densify_mesh_async`."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(thread_name_prefix="ogum-fem")
+        return _executor
 
 
 def densify_mesh_async(
     mesh: Any,
-    temperature_history: List[Tuple[float, float]],
+    temperature_history: List[Tuple[float, float]] | np.ndarray,
     Ea: float,
     A: float,
     solver_options: dict | None = None,
     callback: Callable | None = None,
-) -> tuple[Thread, dict]:
-    """Execute :func:`densify_mesh` in a separate thread."""
-    result: dict = {"densities": None, "error": None}
-    def _target() -> None:
-        try:
-            result["densities"] = densify_mesh(
-                mesh, temperature_history, Ea, A, solver_options
+) -> Future:
+    """Execute :func:`densify_mesh` in a background thread.
+
+    Returns a :class:`~concurrent.futures.Future` that resolves to the
+    densities array. ``callback``, when given, is called on completion with
+    ``{"densities": ..., "error": ...}``.
+    """
+    try:
+        history = _history_array(temperature_history)
+    except (TypeError, ValueError):
+        history = temperature_history  # reported through the future
+    future = _get_executor().submit(
+        densify_mesh, mesh, history, Ea, A, solver_options
+    )
+    if callback is not None:
+
+        def _done(fut: Future) -> None:
+            exc = fut.exception()
+            callback(
+                {"densities": None if exc else fut.result(), "error": exc}
             )
-        except Exception as exc:
-            result["error"] = exc
-        if callback is not None:
-            callback(result)
-    thread = Thread(target=_target, daemon=True)
-    thread.start()
-    return thread, result
+
+        future.add_done_callback(_done)
+    return future
 
 
 __all__ = ["create_unit_mesh", "densify_mesh", "densify_mesh_async"]
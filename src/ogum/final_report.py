@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Callable, List, Optional
-
-import ipywidgets as widgets
-from IPython.display import clear_output
+from typing import TYPE_CHECKING, Callable, List, Optional
 
 from .core import SinteringDataRecord, exibir_mensagem, exibir_erro
 
+if TYPE_CHECKING:  # pragma: no cover - annotations only
+    import ipywidgets as widgets
+
 
 class FinalReportModule:
     """UI module to generate statistical HTML reports."""
@@ -28,6 +28,8 @@ class FinalReportModule:
 
     def _build_ui(self) -> None:
         """Create the widget layout used by the report module."""
+        import ipywidgets as widgets
+
         self.btn_generate = widgets.Button(
             description="Gerar Relatório Estatístico", button_style="info"
         )
@@ -44,6 +46,8 @@ class FinalReportModule:
 
     def _on_generate_report(self, _=None) -> None:
         """Generate the report and display the resulting HTML."""
+        from IPython.display import clear_output
+
         if self.on_busy:
             self.on_busy(True, "Gerando relatório...")
         with self.out:
@@ -51,19 +55,20 @@ class FinalReportModule:
             try:
                 from .stats import bootstrap_ea, shapiro_residuals, generate_report
 
+                required = ("Time_s", "Temperature_C", "DensidadePct")
                 experiments = [
                     rec.df
                     for rec in self.sintering_records
-                    if {"Time_s", "Temperature_C", "DensidadePct"}.issubset(
-                        rec.df.columns
-                    )
+                    if all(col in rec.df.columns for col in required)
                 ]
                 if not experiments:
                     raise ValueError(
                         "Nenhum dataset válido encontrado (Time_s, Temperature_C, DensidadePct)."
                     )
 
-                ci_low, ci_high = bootstrap_ea(experiments)
+                # Serial on purpose: a process pool started from the notebook
+                # kernel breaks under the spawn start method.
+                ci_low, ci_high = bootstrap_ea(experiments, workers=1)
 
                 resid_df = None
                 for rec in self.sintering_records:
@@ -7,25 +7,105 @@ from typing import Literal
 import numpy as np
 import pandas as pd
 
+from .accel import HAS_NUMBA, HAS_NUMEXPR, NUMEXPR_MIN_SIZE, ne, njit
 from .core import R
 
 
-def _estimate_activation_energy(time: np.ndarray, temp_c: np.ndarray, dens: np.ndarray) -> float:
-    """Return activation energy in kJ/mol estimated from densification data."""
+@njit(cache=True)
+def _arrhenius_slope_kernel(time, inv_T, dens, divisor):  # pragma: no cover - jit
+    """Return ``(n, slope)`` of ``ln k_eff`` versus ``1/T`` in two fused passes.
+
+    ``slope`` is NaN when fewer than two points are valid or when all the
+    valid points share the same temperature.
+    """
+    n = 0
+    sum_x = 0.0
+    sum_y = 0.0
+    for i in range(time.size):
+        x = dens[i] / divisor
+        if time[i] > 0 and 0 < x < 1:
+            n += 1
+            sum_x += inv_T[i]
+            sum_y += np.log(-np.log(1.0 - x) / time[i])
+    if n < 2:
+        return n, np.nan
+    mean_x = sum_x / n
+    mean_y = sum_y / n
+    sxx = 0.0
+    sxy = 0.0
+    for i in range(time.size):
+        x = dens[i] / divisor
+        if time[i] > 0 and 0 < x < 1:
+            dx = inv_T[i] - mean_x
+            sxx += dx * dx
+            sxy += dx * (np.log(-np.log(1.0 - x) / time[i]) - mean_y)
+    if sxx <= n * (1e-12 * mean_x) ** 2:
+        return n, np.nan
+    return n, sxy / sxx
+
+
+def _ols_slope_intercept(X: np.ndarray, Y: np.ndarray) -> tuple[float, float]:
+    """Return the least-squares ``(slope, intercept)`` of ``Y`` against ``X``.
+
+    Closed form on centred sums; ``slope`` is NaN when ``X`` is constant.
+    """
+    mean_x = X.mean()
+    mean_y = Y.mean()
+    dx = X - mean_x
+    sxx = np.dot(dx, dx)
+    if sxx <= X.size * (1e-12 * mean_x) ** 2:
+        return np.nan, np.nan
+    slope = np.dot(dx, Y - mean_y) / sxx
+    return float(slope), float(mean_y - slope * mean_x)
+
+
+def _estimate_activation_energy(time: np.ndarray, inv_T_k: np.ndarray, dens: np.ndarray) -> float:
+    """Return activation energy in kJ/mol estimated from densification data.
+
+    ``inv_T_k`` holds the reciprocal absolute temperatures (1/K).
+    """
+    if HAS_NUMBA:
+        divisor = 100.0 if dens.max() > 1.0 else 1.0
+        n, slope = _arrhenius_slope_kernel(
+            np.asarray(time, dtype=np.float64),
+            np.asarray(inv_T_k, dtype=np.float64),
+            np.asarray(dens, dtype=np.float64),
+            divisor,
+        )
+        if n < 2:
+            raise ValueError("Insufficient data for activation energy fit")
+        if np.isfinite(slope):
+            return float(-slope * R / 1000.0)
+        # Isothermal data: defer to the fallback path below.
+
     x = dens.copy().astype(float)
     if x.max() > 1.0:
         x /= 100.0
-    mask = (time > 0) & (0 < x) & (x < 1)
-    if mask.sum() < 2:
+    if HAS_NUMEXPR and x.size >= NUMEXPR_MIN_SIZE:
+        mask = ne.evaluate("(time > 0) & (x > 0) & (x < 1)")
+    else:
+        # One boolean buffer, combined in place.
+        mask = np.greater(time, 0)
+        np.logical_and(mask, x > 0, out=mask)
+        np.logical_and(mask, x < 1, out=mask)
+    idx = np.flatnonzero(mask)
+    if idx.size < 2:
         raise ValueError("Insufficient data for activation energy fit")
-    k_eff = -np.log(1.0 - x[mask]) / time[mask]
-    inv_T = 1.0 / (temp_c[mask].astype(float) + 273.15)
-    slope, _ = np.polyfit(inv_T, np.log(k_eff), 1)
+    k_eff = -np.log(1.0 - x[idx]) / time[idx]
+    slope, _ = _ols_slope_intercept(inv_T_k[idx], np.log(k_eff))
+    if not np.isfinite(slope):
+        # Isothermal data: keep polyfit's minimum-norm solution.
+        slope, _ = np.polyfit(inv_T_k[idx], np.log(k_eff), 1)
     Ea_j = -slope * R
     return float(Ea_j / 1000.0)
 
 
-def build_master_curve(df: pd.DataFrame, method: Literal["arrhenius"] = "arrhenius") -> pd.DataFrame:
+def build_master_curve(
+    df: pd.DataFrame,
+    method: Literal["arrhenius"] = "arrhenius",
+    *,
+    temperature_unit: Literal["C", "K"] = "C",
+) -> pd.DataFrame:
     """Return Arrhenius master curve for densification data.
 
     Parameters
@@ -34,6 +114,8 @@ def build_master_curve(df: pd.DataFrame, method: Literal["arrhenius"] = "arrheni
         Input data with ``time``, ``temperature`` and ``density`` columns.
     method : {{'arrhenius'}}, default 'arrhenius'
         Superposition method to apply.
+    temperature_unit : {{'C', 'K'}}, default 'C'
+        Unit of the ``temperature`` column.
 
     Returns
     -------
@@ -42,19 +124,35 @@ def build_master_curve(df: pd.DataFrame, method: Literal["arrhenius"] = "arrheni
     """
     if method != "arrhenius":
         raise ValueError("Only 'arrhenius' method is supported")
+    if temperature_unit not in ("C", "K"):
+        raise ValueError("temperature_unit must be 'C' or 'K'")
     required = {"time", "temperature", "density"}
     if not required <= set(df.columns):
         raise ValueError("Input DataFrame must contain 'time', 'temperature' and 'density'")
 
     t = df["time"].to_numpy(float)
-    T_c = df["temperature"].to_numpy(float)
+    T_k = df["temperature"].to_numpy(float)
+    if temperature_unit == "C":
+        T_k = T_k + 273.15
+    inv_T_k = 1.0 / T_k
     dens = df["density"].to_numpy(float)
 
-    Ea_kJ = _estimate_activation_energy(t, T_c, dens)
-    T_ref = np.mean(T_c) + 273.15
-    T_k = T_c + 273.15
-    a_T = np.exp((Ea_kJ * 1000.0 / R) * (1.0 / T_k - 1.0 / T_ref))
-    master_time = t * a_T
+    Ea_kJ = _estimate_activation_energy(t, inv_T_k, dens)
+    T_ref = np.mean(T_k)
+    if HAS_NUMEXPR and t.size >= NUMEXPR_MIN_SIZE:
+        # Single multithreaded pass, no intermediate arrays.
+        master_time = ne.evaluate(
+            "t * exp(B * (inv_T_k - inv_T_ref))",
+            local_dict={
+                "t": t,
+                "inv_T_k": inv_T_k,
+                "B": Ea_kJ * 1000.0 / R,
+                "inv_T_ref": 1.0 / T_ref,
+            },
+        )
+    else:
+        a_T = np.exp((Ea_kJ * 1000.0 / R) * (inv_T_k - 1.0 / T_ref))
+        master_time = t * a_T
 
     result = pd.DataFrame(
         {
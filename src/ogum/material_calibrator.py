@@ -2,15 +2,49 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-from scipy.optimize import curve_fit
 
+from .accel import HAS_NUMEXPR, NUMEXPR_MIN_SIZE, ne, njit
 from .core import R
 
 
+@njit(cache=True)
+def _euler_kernel(t: np.ndarray, rates: np.ndarray) -> np.ndarray:
+    """Integrate ``dx/dt = k (1 - x)`` with explicit Euler steps from ``x = 0``.
+
+    Compiled by numba when available; otherwise runs as plain Python.
+    """
+    x = np.zeros(t.size)
+    for i in range(1, t.size):
+        x[i] = x[i - 1] + (t[i] - t[i - 1]) * (1.0 - x[i - 1]) * rates[i - 1]
+    return x
+
+
+@njit(cache=True)
+def _euler_jac_kernel(
+    t: np.ndarray, rates: np.ndarray, d_rates: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Run :func:`_euler_kernel` together with its parameter sensitivities.
+
+    ``d_rates`` holds ``dk/dp`` for each parameter column. The sensitivities
+    obey ``s_i = s_{i-1} (1 - dt k_{i-1}) + dt (1 - x_{i-1}) dk_{i-1}/dp``.
+    """
+    n = t.size
+    x = np.zeros(n)
+    jac = np.zeros((n, d_rates.shape[1]))
+    for i in range(1, n):
+        dt = t[i] - t[i - 1]
+        remaining = 1.0 - x[i - 1]
+        decay = 1.0 - dt * rates[i - 1]
+        x[i] = x[i - 1] + dt * remaining * rates[i - 1]
+        for j in range(d_rates.shape[1]):
+            jac[i, j] = jac[i - 1, j] * decay + dt * remaining * d_rates[i - 1, j]
+    return x, jac
+
+
 class MaterialCalibrator:
     """Fit and predict densification using an Arrhenius model."""
 
@@ -34,13 +68,89 @@ class MaterialCalibrator:
 
     @staticmethod
     def _densification(t: np.ndarray, T_c: np.ndarray, Ea: float, A: float) -> np.ndarray:
-        T_k = T_c + 273.15
+        return MaterialCalibrator._densification_kelvin(t, T_c + 273.15, Ea, A)
+
+    @staticmethod
+    def _densification_kelvin(
+        t: np.ndarray, T_k: np.ndarray, Ea: float, A: float
+    ) -> np.ndarray:
         rates = MaterialCalibrator._arrhenius_rate(T_k, Ea, A)
-        x = np.zeros_like(t, dtype=float)
-        for i in range(1, len(t)):
-            dt = t[i] - t[i - 1]
-            x[i] = x[i - 1] + dt * (1.0 - x[i - 1]) * rates[i - 1]
-        return x
+        return _euler_kernel(
+            np.ascontiguousarray(t, dtype=np.float64),
+            np.ascontiguousarray(rates, dtype=np.float64),
+        )
+
+    @staticmethod
+    def _densification_jac(
+        t: np.ndarray,
+        T_k: np.ndarray,
+        Ea: float,
+        A: float,
+        inv_RT: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the densification curve and its ``(n, 2)`` Jacobian.
+
+        Columns of the Jacobian are ``dx/dEa`` (per kJ/mol) and ``dx/dA``.
+        ``inv_RT`` may carry a precomputed ``1 / (R * T_k)``, which only
+        depends on the temperatures and so is constant across a fit.
+        """
+        if inv_RT is None:
+            inv_RT = 1.0 / (R * T_k)
+        boltzmann = np.exp((-Ea * 1000.0) * inv_RT)
+        rates = A * boltzmann
+        d_rates = np.empty((rates.size, 2))
+        np.multiply(rates, inv_RT, out=d_rates[:, 0])
+        d_rates[:, 0] *= -1000.0
+        d_rates[:, 1] = boltzmann
+        return _euler_jac_kernel(
+            np.ascontiguousarray(t, dtype=np.float64),
+            np.ascontiguousarray(rates, dtype=np.float64),
+            d_rates,
+        )
+
+    @staticmethod
+    def _arrhenius_seed(
+        t: np.ndarray, T_k: np.ndarray, x: np.ndarray
+    ) -> Optional[Tuple[float, float]]:
+        """Return ``(Ea, A)`` from a linear fit of ``ln k`` against ``1/T``.
+
+        The rate at each step is recovered by inverting the Euler update used
+        in :meth:`_densification`. ``None`` is returned when fewer than two
+        steps are usable or all of them share one temperature.
+        """
+        x_prev = x[:-1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if HAS_NUMEXPR and x.size >= NUMEXPR_MIN_SIZE:
+                ln_rate = ne.evaluate(
+                    "log((x1 - x0) / ((t1 - t0) * (1.0 - x0)))",
+                    local_dict={"x1": x[1:], "x0": x_prev, "t1": t[1:], "t0": t[:-1]},
+                )
+            else:
+                # Explicit forward differences, divided in place.
+                ln_rate = x[1:] - x_prev
+                ln_rate /= t[1:] - t[:-1]
+                ln_rate /= 1.0 - x_prev
+                np.log(ln_rate, out=ln_rate)
+            # Non-positive or infinite rates leave a non-finite logarithm.
+            valid = np.isfinite(ln_rate)
+            np.logical_and(valid, x_prev >= 0, out=valid)
+            np.logical_and(valid, x_prev < 1, out=valid)
+            X = np.where(valid, 1.0 / T_k[:-1], 0.0)
+            Y = np.where(valid, ln_rate, 0.0)
+        n = np.count_nonzero(valid)
+        if n < 2:
+            return None
+        mean_x = X.sum() / n
+        mean_y = Y.sum() / n
+        dx = np.where(valid, X - mean_x, 0.0)
+        sxx = np.dot(dx, dx)
+        if sxx <= n * (1e-12 * mean_x) ** 2:
+            return None
+        slope = np.dot(dx, Y - mean_y) / sxx
+        Ea = -slope * R / 1000.0
+        if not Ea > 0:
+            return None
+        return float(Ea), float(np.exp(mean_y - slope * mean_x))
 
     def fit(self, df: pd.DataFrame) -> Dict[str, float]:
         """Estimate ``Ea`` and ``A`` from experimental data.
@@ -55,17 +165,62 @@ class MaterialCalibrator:
         dict
             Dictionary with keys ``'Ea'`` and ``'A'``.
         """
-        t = df["Time_s"].to_numpy(dtype=float)
-        T = df["Temperature_C"].to_numpy(dtype=float)
-        y = df["DensidadePct"].to_numpy(dtype=float) / 100.0
+        # float64 columns come back as views; only other dtypes are converted.
+        return self.fit_arrays(
+            df["Time_s"].to_numpy(dtype=np.float64, copy=False),
+            df["Temperature_C"].to_numpy(dtype=np.float64, copy=False),
+            df["DensidadePct"].to_numpy(dtype=np.float64, copy=False),
+        )
+
+    def fit_arrays(
+        self, t: np.ndarray, T_c: np.ndarray, dens_pct: np.ndarray
+    ) -> Dict[str, float]:
+        """Estimate ``Ea`` and ``A`` from plain arrays.
+
+        Same as :meth:`fit` for callers that already hold the columns as
+        float arrays (time in s, temperature in °C, density in percent).
+        """
+        # Converted once here rather than on every model evaluation.
+        T_k = T_c + 273.15
+        inv_RT = 1.0 / (R * T_k)
+        y = dens_pct / 100.0
 
-        def model(arr: tuple[np.ndarray, np.ndarray], Ea: float, A: float) -> np.ndarray:
-            times, temps = arr
-            return MaterialCalibrator._densification(times, temps, Ea, A)
+        # One forward pass yields both the curve and its sensitivities; keep
+        # the latest so the residual and Jacobian calls share it.
+        last: dict = {}
+
+        def _evaluate(Ea: float, A: float) -> dict:
+            if last.get("params") != (Ea, A):
+                last["x"], last["jac"] = MaterialCalibrator._densification_jac(
+                    t, T_k, Ea, A, inv_RT
+                )
+                last["params"] = (Ea, A)
+            return last
+
+        def residual(p: np.ndarray) -> np.ndarray:
+            return _evaluate(p[0], p[1])["x"] - y
+
+        def jac(p: np.ndarray) -> np.ndarray:
+            return _evaluate(p[0], p[1])["jac"]
 
         p0 = [self.Ea if self.Ea is not None else 50.0, self.A if self.A is not None else 1.0]
-        popt, _ = curve_fit(model, (t, T), y, p0=p0, bounds=(0.0, np.inf))
-        self.Ea, self.A = float(popt[0]), float(popt[1])
+        if self.Ea is None and self.A is None:
+            seed = MaterialCalibrator._arrhenius_seed(t, T_k, y)
+            if seed is not None:
+                if np.max(np.abs(residual(seed))) <= 1e-9:
+                    # The linear regression already reproduces the data
+                    # exactly; the least-squares optimiser has nothing to add.
+                    self.Ea, self.A = seed
+                    return {"Ea": self.Ea, "A": self.A}
+                p0 = list(seed)
+        from scipy.optimize import least_squares
+
+        # Ea (tens of kJ/mol) and A (orders of magnitude apart) are scaled by
+        # the Jacobian column norms so the trust region is not lopsided.
+        res = least_squares(
+            residual, p0, jac=jac, bounds=(0.0, np.inf), method="trf", x_scale="jac"
+        )
+        self.Ea, self.A = float(res.x[0]), float(res.x[1])
         return {"Ea": self.Ea, "A": self.A}
 
     def predict(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -83,22 +238,45 @@ class MaterialCalibrator:
         """
         if self.Ea is None or self.A is None:
             raise ValueError("Model parameters not fitted")
-        t = df["Time_s"].to_numpy(dtype=float)
-        T = df["Temperature_C"].to_numpy(dtype=float)
+        t = df["Time_s"].to_numpy(dtype=np.float64, copy=False)
+        T = df["Temperature_C"].to_numpy(dtype=np.float64, copy=False)
         dens = MaterialCalibrator._densification(t, T, self.Ea, self.A) * 100.0
-        result = df.copy()
-        result["predicted_density"] = dens
-        return result
+        # ``assign`` leaves the input untouched; under copy-on-write it also
+        # shares the existing columns instead of duplicating them.
+        return df.assign(predicted_density=dens)
 
     @staticmethod
-    def simulate_synthetic(ea_kJ: float, A: float, time_array: np.ndarray) -> pd.DataFrame:
-        """Generate synthetic densification data for testing."""
-        T_c = np.full_like(time_array, 1000.0)
-        dens = MaterialCalibrator._densification(time_array, T_c, ea_kJ, A)
+    def simulate_synthetic(
+        ea_kJ: float,
+        A: float,
+        time_array: np.ndarray,
+        temperature_c: float | np.ndarray = 1000.0,
+    ) -> pd.DataFrame:
+        """Generate synthetic densification data for testing.
+
+        ``temperature_c`` is either a constant (°C) or one value per time
+        sample; non-isothermal histories go through the Euler integrator.
+        """
+        time_array = np.asarray(time_array, dtype=float)
+        T_c = np.array(np.broadcast_to(temperature_c, time_array.shape), dtype=float)
+        steps = None
+        if T_c.size and np.all(T_c == T_c[0]):
+            k = MaterialCalibrator._arrhenius_rate(T_c[0] + 273.15, ea_kJ, A)
+            steps = k * np.diff(time_array)
+        if steps is not None and np.all(steps < 1.0):
+            # At constant temperature the Euler update is a running product,
+            # 1 - x_i = prod(1 - k*dt_j), evaluated in log space.
+            dens_pct = np.zeros(len(time_array), dtype=float)
+            np.cumsum(np.log1p(-steps), out=dens_pct[1:])
+            np.expm1(dens_pct[1:], out=dens_pct[1:])
+            dens_pct *= -100.0
+        else:
+            dens = MaterialCalibrator._densification(time_array, T_c, ea_kJ, A)
+            dens_pct = dens * 100.0
         return pd.DataFrame({
             "Time_s": time_array,
             "Temperature_C": T_c,
-            "DensidadePct": dens * 100.0,
+            "DensidadePct": dens_pct,
         })
 
 
@@ -2,15 +2,118 @@
 
 from __future__ import annotations
 
-import random
 import tempfile
 
+import numpy as np
+
+#: Above this many spheres the pores are carved with ``fragment`` instead of
+#: ``cut``, whose cost in OpenCASCADE grows superlinearly with the tool count.
+FRAGMENT_MIN_SPHERES = 200
+
+#: Clearance, relative to the radius, kept between lattice-placed spheres
+#: and from the box walls, so gmsh never sees tangent surfaces.
+_LATTICE_GAP = 0.01
+
+
+def _lattice_centers(radius: float, box_size: float) -> np.ndarray:
+    """Return the sites of the largest face-centred cubic grid that fits.
+
+    The grid is stretched to fill the box; neighbouring sites stay at least
+    ``2 * radius * (1 + _LATTICE_GAP)`` apart. An empty array is returned
+    when a single sphere does not fit.
+    """
+    r_eff = radius * (1.0 + _LATTICE_GAP)
+    span = box_size - 2.0 * r_eff
+    if span < 0:
+        return np.empty((0, 3))
+    # FCC neighbours are sqrt(2) grid steps apart; ``ceil`` keeps the step
+    # strictly above the minimum, so spheres never touch.
+    m = max(1, int(np.ceil(span / (np.sqrt(2.0) * r_eff))))
+    if m == 1:
+        return np.full((1, 3), box_size / 2.0)
+    idx = np.indices((m, m, m)).reshape(3, -1).T
+    idx = idx[idx.sum(axis=1) % 2 == 0]
+    return r_eff + idx * (span / (m - 1))
+
+
+def _max_lattice_radius(box_size: float, n_spheres: int) -> float:
+    """Largest radius for which :func:`_lattice_centers` holds ``n_spheres``."""
+    lo, hi = 0.0, box_size / 2.0
+    for _ in range(50):
+        mid = (lo + hi) / 2.0
+        if len(_lattice_centers(mid, box_size)) >= n_spheres:
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
+
+def _sample_centers(
+    radius: float,
+    box_size: float,
+    n_spheres: int,
+    rng: np.random.Generator,
+    max_rounds: int = 50,
+) -> np.ndarray:
+    """Return ``(n_spheres, 3)`` non-overlapping sphere centres inside the box.
+
+    Spheres are placed one after another (random sequential addition): a
+    candidate is kept only if it clears every sphere accepted before it, so
+    gmsh never receives intersecting tools. Candidates are drawn in batches
+    and screened against the accepted centres with a KD-tree. Random
+    addition jams well below the densest packing, so if ``max_rounds``
+    batches do not place every sphere, ``n_spheres`` sites are picked from
+    a face-centred cubic lattice instead; only when that lattice is too
+    small as well is ``ValueError`` raised.
+    """
+    from scipy.spatial import cKDTree
+
+    min_dist = 2.0 * radius
+    centers = np.empty((0, 3))
+    for _ in range(max_rounds):
+        need = n_spheres - len(centers)
+        if need <= 0:
+            break
+        candidates = rng.uniform(radius, box_size - radius, (max(4 * need, 64), 3))
+        if len(centers):
+            dist, _ = cKDTree(centers).query(
+                candidates, distance_upper_bound=min_dist
+            )
+            candidates = candidates[dist > min_dist]
+        # Greedy pass in draw order: each kept candidate blocks the later
+        # ones it overlaps (``query_pairs`` yields ``i < j``).
+        pairs = cKDTree(candidates).query_pairs(min_dist, output_type="ndarray")
+        pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+        bounds = np.searchsorted(pairs[:, 0], np.arange(len(candidates) + 1))
+        blocked = np.zeros(len(candidates), dtype=bool)
+        chosen = []
+        for i in range(len(candidates)):
+            if blocked[i]:
+                continue
+            chosen.append(i)
+            if len(chosen) == need:
+                break
+            blocked[pairs[bounds[i]:bounds[i + 1], 1]] = True
+        centers = np.vstack([centers, candidates[chosen]])
+    if len(centers) >= n_spheres:
+        return centers
+
+    sites = _lattice_centers(radius, box_size)
+    if len(sites) < n_spheres:
+        raise ValueError(
+            f"Não foi possível posicionar {n_spheres} esferas sem sobreposição"
+        )
+    pick = rng.choice(len(sites), size=n_spheres, replace=False)
+    return sites[np.sort(pick)]
+
 
 def generate_mesh(
     radius: float,
     box_size: float,
     element_size: float,
     n_spheres: int,
+    *,
+    seed: int | None = None,
 ) -> str:
     """Create a mesh of ``n_spheres`` packed in a box.
 
@@ -24,6 +127,8 @@ def generate_mesh(
         Target mesh element size.
     n_spheres : int
         Number of spheres inside the box.
+    seed : int, optional
+        Seed for the sphere placement, for reproducible packings.
 
     Returns:
     -------
@@ -42,20 +147,27 @@ def generate_mesh(
         gmsh.option.setNumber("Mesh.CharacteristicLengthMin", element_size)
         gmsh.option.setNumber("Mesh.CharacteristicLengthMax", element_size)
         gmsh.model.occ.addBox(0, 0, 0, box_size, box_size, box_size, 1)
-        sphere_tags: list[int] = []
-        for _ in range(n_spheres):
-            x = random.uniform(radius, box_size - radius)
-            y = random.uniform(radius, box_size - radius)
-            z = random.uniform(radius, box_size - radius)
-            tag = gmsh.model.occ.addSphere(x, y, z, radius)
-            sphere_tags.append(tag)
-
-        gmsh.model.occ.cut(
-            [(3, 1)],
-            [(3, t) for t in sphere_tags],
-            removeObject=False,
-            removeTool=True,
+        centers = _sample_centers(
+            radius, box_size, n_spheres, np.random.default_rng(seed)
         )
+        sphere_tags = [
+            gmsh.model.occ.addSphere(x, y, z, radius) for x, y, z in centers.tolist()
+        ]
+
+        tools = [(3, t) for t in sphere_tags]
+        if n_spheres > FRAGMENT_MIN_SPHERES:
+            # The spheres are disjoint and inside the box, so fragmenting yields
+            # the porous matrix plus one volume per sphere; drop the latter.
+            _, pieces = gmsh.model.occ.fragment([(3, 1)], tools)
+            inside = {dim_tag for piece in pieces[1:] for dim_tag in piece}
+            gmsh.model.occ.remove(sorted(inside), recursive=True)
+        else:
+            gmsh.model.occ.cut(
+                [(3, 1)],
+                tools,
+                removeObject=False,
+                removeTool=True,
+            )
         gmsh.model.occ.synchronize()
         gmsh.model.mesh.generate(3)
         tmp = tempfile.NamedTemporaryFile(suffix=".msh", delete=False)
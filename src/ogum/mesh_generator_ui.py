@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import math
+
 import ipywidgets as widgets
 from IPython.display import clear_output, display
-import pyvista as pv
 
-from .mesh_generator import generate_mesh
+from .mesh_generator import _max_lattice_radius, generate_mesh
 
 
 class MeshGeneratorUI:
@@ -50,6 +51,9 @@ class MeshGeneratorUI:
                 self.output,
             ]
         )
+        # Registered first so the radius bound is current before a redraw.
+        for w in (self.box_slider, self.num_dropdown):
+            w.observe(self._limit_radius, names="value")
         for w in (
             self.radius_slider,
             self.box_slider,
@@ -58,13 +62,26 @@ class MeshGeneratorUI:
         ):
             w.observe(self._update, names="value")
         self.mesh_path: str | None = None
+        self._limit_radius()
         self._update()
 
+    def _limit_radius(self, _=None) -> None:
+        """Cap the radius slider so the chosen spheres always fit the box."""
+        limit = _max_lattice_radius(
+            self.box_slider.value, int(self.num_dropdown.value)
+        )
+        step = self.radius_slider.step
+        self.radius_slider.max = max(
+            self.radius_slider.min, math.floor(limit / step) * step
+        )
+
     def _update(self, _=None) -> None:
         """Regenerate and plot the mesh using current widget values."""
         with self.output:
             clear_output(wait=True)
             try:
+                import pyvista as pv
+
                 self.mesh_path = generate_mesh(
                     self.radius_slider.value,
                     self.box_slider.value,
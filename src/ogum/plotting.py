@@ -1,9 +1,12 @@
 """Plotting helpers for visualizing sintering experiments."""
 
 import matplotlib.pyplot as plt
+from matplotlib.lines import Line2D
 import pandas as pd
 from typing import Optional, Sequence, Tuple
 
+from .utils import _resolve_columns
+
 
 def plot_sintering_curves(
     df_ensaio: pd.DataFrame, ax: Optional[plt.Axes] = None
@@ -24,12 +27,8 @@ def plot_sintering_curves(
     (figure, axes)
         The created figure and list of axes.
     """
-    time_col = next((c for c in df_ensaio.columns if c.startswith("Time_s")), None)
-    temp_col = next(
-        (c for c in df_ensaio.columns if c.startswith("Temperature_C")), None
-    )
-    dens_col = next(
-        (c for c in df_ensaio.columns if c.startswith("DensidadePct")), None
+    time_col, temp_col, dens_col = _resolve_columns(
+        tuple(df_ensaio.columns), ("Time_s", "Temperature_C", "DensidadePct")
     )
     if not (time_col and temp_col and dens_col):
         raise ValueError("Required columns missing")
@@ -43,14 +42,21 @@ def plot_sintering_curves(
 
     fig.suptitle("Sintering Curves")
 
-    axs[0].plot(df_ensaio[time_col], df_ensaio[dens_col], ".-")
-    axs[0].set(xlabel="Tempo (s)", ylabel="Densidade (%)")
-
-    axs[1].plot(df_ensaio[temp_col], df_ensaio[dens_col], "r.-")
-    axs[1].set(xlabel="Temperatura (°C)", ylabel="Densidade (%)")
-
-    axs[2].plot(df_ensaio[time_col], df_ensaio[temp_col], "g.-")
-    axs[2].set(xlabel="Tempo (s)", ylabel="Temperatura (°C)")
+    time = df_ensaio[time_col].to_numpy()
+    temp = df_ensaio[temp_col].to_numpy()
+    dens = df_ensaio[dens_col].to_numpy()
+    panels = (
+        (time, dens, "C0", "Tempo (s)", "Densidade (%)"),
+        (temp, dens, "r", "Temperatura (°C)", "Densidade (%)"),
+        (time, temp, "g", "Tempo (s)", "Temperatura (°C)"),
+    )
+    for a, (x, y, color, xlabel, ylabel) in zip(axs, panels):
+        # A ready-made Line2D skips ``plot``'s format-string parsing and
+        # property cycling; the view is autoscaled once per axis.
+        a.add_line(Line2D(x, y, color=color, linestyle="-", marker="."))
+        a.autoscale_view()
+        a.set_xlabel(xlabel)
+        a.set_ylabel(ylabel)
 
     for a in axs:
         a.grid(True, alpha=0.5)
@@ -5,7 +5,32 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 
+from .accel import HAS_NUMBA, njit
 from .core import R, cumtrapz
+from .utils import _resolve_columns
+
+_LOG10_TINY = float(np.log10(np.finfo(float).tiny))
+
+
+@njit(cache=True, nogil=True)
+def _theta_integral_kernel(t, T_k, Ea_j):  # pragma: no cover - jit
+    """Cumulative trapezoid of ``exp(-Ea/(R T)) / T`` over ``t``, in one scan.
+
+    The integrand is evaluated inside the loop, so no ``theta_inst`` array
+    is materialised; the sums follow the same order as
+    ``scipy.integrate.cumulative_trapezoid`` with ``initial=0``. Runs without
+    the GIL, so several experiments can be processed from a thread pool.
+    """
+    out = np.empty(t.size)
+    out[0] = 0.0
+    acc = 0.0
+    prev = (1.0 / T_k[0]) * np.exp(-Ea_j / (R * T_k[0]))
+    for i in range(1, t.size):
+        cur = (1.0 / T_k[i]) * np.exp(-Ea_j / (R * T_k[i]))
+        acc += (t[i] - t[i - 1]) * (prev + cur) / 2.0
+        out[i] = acc
+        prev = cur
+    return out
 
 
 # -----------------------------------------------------------------------------#
@@ -14,6 +39,8 @@ from .core import R, cumtrapz
 def calculate_log_theta(
     df_ensaio: pd.DataFrame,
     energia_ativacao_kj: float | None = None,
+    *,
+    cols: tuple[str, str, str] | None = None,
     **kwargs,
 ) -> pd.DataFrame:
     """Calcula log‑theta para um ensaio e uma *Ea* dada.
@@ -29,6 +56,9 @@ def calculate_log_theta(
         ``DensidadePct*`` (podem possuir sufixos).
     energia_ativacao_kj : float, optional
         Energia de ativação em kJ/mol.
+    cols : tuple of str, optional
+        Nomes já resolvidos ``(tempo, temperatura, densidade)``; evita
+        procurar as colunas de novo quando vários ensaios têm o mesmo esquema.
     **kwargs :
         Permite receber ``Ea_kJ=`` ou ``Ea_kj=`` sem quebrar código existente.
 
@@ -51,41 +81,94 @@ def calculate_log_theta(
     # ------------------------------------------------------------------#
     # Localiza colunas com possíveis sufixos
     # ------------------------------------------------------------------#
-    time_col = next((c for c in df_ensaio.columns if c.startswith("Time_s")), None)
-    temp_col = next((c for c in df_ensaio.columns if c.startswith("Temperature_C")), None)
-    dens_col = next((c for c in df_ensaio.columns if c.startswith("DensidadePct")), None)
+    if cols is None:
+        cols = _resolve_columns(
+            tuple(df_ensaio.columns), ("Time_s", "Temperature_C", "DensidadePct")
+        )
+    time_col, temp_col, dens_col = cols
 
     if not (time_col and temp_col and dens_col):
         raise ValueError("Required columns missing")
 
-    if df_ensaio[time_col].size < 2:
+    # ``valor`` e ``tempo_s`` voltam no resultado: copiados uma vez aqui para
+    # que o DataFrame possa adotar os arrays sem consolidá-los num novo bloco.
+    log_integrated, valor, tempo_s = calculate_log_theta_arrays(
+        df_ensaio[time_col].to_numpy(copy=True),
+        df_ensaio[temp_col].to_numpy(),
+        df_ensaio[dens_col].to_numpy(copy=True),
+        energia_ativacao_kj,
+    )
+    return pd.DataFrame(
+        {
+            "logtheta": log_integrated,
+            "valor": valor,
+            "tempo_s": tempo_s,
+        },
+        copy=False,
+    )
+
+
+def calculate_log_theta_arrays(
+    tempo_s: np.ndarray,
+    temperatura_c: np.ndarray,
+    valor: np.ndarray,
+    energia_ativacao_kj: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Calcula log‑theta diretamente sobre arrays NumPy.
+
+    Núcleo numérico de :func:`calculate_log_theta`, útil quando os dados já
+    estão em arrays (por exemplo, payloads JSON da API) e construir um
+    ``DataFrame`` seria apenas overhead.
+
+    Parameters
+    ----------
+    tempo_s : np.ndarray
+        Tempos do ensaio em segundos.
+    temperatura_c : np.ndarray
+        Temperaturas em °C, mesmo tamanho de ``tempo_s``.
+    valor : np.ndarray
+        Valores associados (densidade), devolvidos sem alteração.
+    energia_ativacao_kj : float
+        Energia de ativação em kJ/mol.
+
+    Returns:
+    -------
+    tuple of np.ndarray
+        ``(logtheta, valor, tempo_s)``.
+    """
+    tempo_s = np.asarray(tempo_s)
+    valor = np.asarray(valor)
+    if tempo_s.size < 2:
         raise ValueError("Insufficient data for integration")
 
     # ------------------------------------------------------------------#
     # Cálculo do log‑theta
     # ------------------------------------------------------------------#
-    T_k = df_ensaio[temp_col].to_numpy(dtype=float) + 273.15
+    T_k = np.asarray(temperatura_c, dtype=float) + 273.15
+    if np.all(tempo_s == tempo_s[0]) and np.isfinite(T_k).all():
+        # Intervalo de tempo nulo: a integral é zero em todos os pontos,
+        # o que dá log10(tiny) sem precisar de exp/integração.
+        return np.full(tempo_s.size, _LOG10_TINY), valor, tempo_s
     Ea_j = energia_ativacao_kj * 1000.0
 
-    theta_inst = (1.0 / T_k) * np.exp(-Ea_j / (R * T_k))
-    integrated = cumtrapz(
-        theta_inst,
-        df_ensaio[time_col].to_numpy(dtype=float),
-        initial=0,
-    )
-
+    if HAS_NUMBA:
+        integrated = _theta_integral_kernel(
+            np.ascontiguousarray(tempo_s, dtype=np.float64),
+            np.ascontiguousarray(T_k),
+            float(Ea_j),
+        )
+    else:
+        theta_inst = (1.0 / T_k) * np.exp(-Ea_j / (R * T_k))
+        integrated = cumtrapz(theta_inst, tempo_s.astype(float, copy=False), initial=0)
+
+    # ``integrated`` é um array novo: zeros e log10 são tratados in place.
+    # Um clip não serviria, pois integrais negativas devem virar NaN.
+    integrated[integrated == 0] = np.finfo(float).tiny
     with np.errstate(divide="ignore", invalid="ignore"):
-        safe_int = np.where(integrated == 0, np.finfo(float).tiny, integrated)
-        log_integrated = np.log10(safe_int)
+        log_integrated = np.log10(integrated, out=integrated)
     log_integrated[~np.isfinite(log_integrated)] = np.nan
 
-    return pd.DataFrame(
-        {
-            "logtheta": log_integrated,
-            "valor": df_ensaio[dens_col].to_numpy(),
-            "tempo_s": df_ensaio[time_col].to_numpy(),
-        }
-    )
+    return log_integrated, valor, tempo_s
 
 
-__all__ = ["calculate_log_theta"]
+__all__ = ["calculate_log_theta", "calculate_log_theta_arrays"]
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Dict, Iterable, Optional
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
 
+import numpy as np
 import pandas as pd
-from scipy.signal import savgol_filter as _savgol_filter
 
 
 def normalize_columns(
@@ -30,24 +31,79 @@ def normalize_columns(
     return df.rename(columns=renames)
 
 
+@lru_cache(maxsize=32)
+def _resolve_columns(
+    columns: Tuple[str, ...], prefixes: Tuple[str, ...]
+) -> Tuple[Optional[str], ...]:
+    """Return the first column starting with each prefix (``None`` if absent).
+
+    Cached per schema so repeated calls on frames with the same columns skip
+    the prefix scan; on a miss the columns are walked once for all prefixes.
+    """
+    found: Dict[str, str] = {}
+    for c in columns:
+        for prefix in prefixes:
+            if prefix not in found and c.startswith(prefix):
+                found[prefix] = c
+        if len(found) == len(prefixes):
+            break
+    return tuple(found.get(prefix) for prefix in prefixes)
+
+
+def _uniform_bin_length(time: np.ndarray, bins: np.ndarray, bin_size: float) -> int:
+    """Return the number of samples per bin for uniformly sampled data.
+
+    Zero is returned when ``time`` is not evenly spaced or when the bin labels
+    do not follow the regular ``n`` samples-per-bin pattern (e.g. the first
+    sample is not aligned with a bin boundary), in which case the generic
+    ``groupby`` path must be used.
+    """
+    dt = np.diff(time)
+    if dt.size == 0:
+        return 0
+    step = dt.mean()
+    if step <= 0 or dt.std() >= 1e-6 * step:
+        return 0
+    n = int(round(bin_size / step))
+    if n < 1:
+        return 0
+    expected = bins[0] + np.arange(bins.size) // n
+    return n if np.array_equal(bins, expected) else 0
+
+
 def orlandini_araujo_filter(df: pd.DataFrame, bin_size: int = 10) -> pd.DataFrame:
     """Apply the Orlandini–Araújo smoothing filter.
 
     The function averages the data in ``bin_size`` second windows. It requires
     columns starting with ``"Time_s"``, ``"Temperature_C"`` and
-    ``"DensidadePct"``.
+    ``"DensidadePct"``. Uniformly sampled series (fixed acquisition rate) are
+    averaged with a reshape instead of a ``groupby``.
     """
-    time_col = next((c for c in df.columns if c.startswith("Time_s")), None)
-    temp_col = next((c for c in df.columns if c.startswith("Temperature_C")), None)
-    dens_col = next((c for c in df.columns if c.startswith("DensidadePct")), None)
+    time_col, temp_col, dens_col = _resolve_columns(
+        tuple(df.columns), ("Time_s", "Temperature_C", "DensidadePct")
+    )
 
     if not (time_col and temp_col and dens_col):
         raise ValueError("Required columns missing")
 
-    dfc = df[[time_col, temp_col, dens_col]].copy()
-    dfc["bin"] = (dfc[time_col] // bin_size).astype(int)
-    grouped = dfc.groupby("bin")[[time_col, temp_col, dens_col]].mean()
-    return grouped.reset_index(drop=True)
+    cols = [time_col, temp_col, dens_col]
+    time = df[time_col].to_numpy(dtype=float)
+    bins = (time // bin_size).astype(int)
+
+    n = _uniform_bin_length(time, bins, bin_size)
+    values = df[cols].to_numpy(dtype=float) if n else None
+    # ``groupby().mean()`` skips missing readings; the reshape would spread
+    # a NaN over its whole bin, so such data takes the generic path.
+    if n and not np.isnan(values).any():
+        trim = (len(values) // n) * n
+        means = values[:trim].reshape(-1, n, len(cols)).mean(axis=1)
+        if trim < len(values):
+            means = np.vstack([means, values[trim:].mean(axis=0)])
+        return pd.DataFrame(means, columns=cols)
+
+    # Grouping by the label array directly avoids copying the frame just to
+    # attach a temporary ``bin`` column.
+    return df[cols].groupby(bins, sort=True).mean().reset_index(drop=True)
 
 
 def savgol_filter(
@@ -63,18 +119,27 @@ def savgol_filter(
     if df.empty:
         return df.copy()
 
+    from scipy.signal import savgol_filter as _savgol_filter
+
     if window is None:
         window = min(11, max(3, (len(df) // 2) * 2 + 1))
     if window % 2 == 0:
         window += 1
 
     df_filtered = df.copy()
-    for col in df_filtered.select_dtypes(include="number").columns:
-        if len(df_filtered[col]) < polyorder + 1:
-            continue
-        df_filtered[col] = _savgol_filter(
-            df_filtered[col].to_numpy(), window, polyorder
-        )
+    numeric = df_filtered.select_dtypes(include="number").columns
+    if len(numeric) and len(df_filtered) >= polyorder + 1:
+        # All columns share one length, so one call along axis 0 per dtype
+        # builds the coefficients once and filters those columns together.
+        # scipy works in float32 for float32 input and float64 otherwise;
+        # grouping that way keeps the per-column result dtypes.
+        single = (df_filtered[numeric].dtypes == np.float32).to_numpy()
+        groups = ((numeric[~single], np.float64), (numeric[single], np.float32))
+        for cols, dtype in groups:
+            if len(cols):
+                df_filtered[cols] = _savgol_filter(
+                    df_filtered[cols].to_numpy(dtype=dtype), window, polyorder, axis=0
+                )
 
     return df_filtered
 
@@ -4,6 +4,9 @@ import sys
 from pathlib import Path
 import types
 
+import numpy as np
+import pytest
+
 # Ensure project root and ``src`` directory are on ``sys.path`` so test modules
 # can import ``ogum`` both locally and when installed.
 ROOT = Path(__file__).resolve().parents[1]
@@ -37,7 +40,8 @@ if "ipywidgets" not in sys.modules:
     class DummyModule(types.ModuleType):
         class Dummy:
             def __init__(self, *args, **kwargs):
-                pass
+                # Keep constructor options (``value=`` etc.) readable.
+                self.__dict__.update(kwargs)
 
             def __call__(self, *args, **kwargs):
                 return self
@@ -59,3 +63,21 @@ if "ipywidgets" not in sys.modules:
 
     widgets_mod = DummyModule("ipywidgets")
     sys.modules["ipywidgets"] = widgets_mod
+
+
+# Shared synthetic data. Session-scoped, so each set is simulated once per
+# run; tests must treat the frames as read-only.
+
+
+@pytest.fixture(scope="session")
+def ramp_experiments():
+    """Three noiseless heating ramps (Ea=150 kJ/mol, A=5e3) from 900 °C."""
+    from ogum.material_calibrator import MaterialCalibrator
+
+    t = np.linspace(0, 600, 40)
+    return [
+        MaterialCalibrator.simulate_synthetic(
+            150.0, 5e3, t, np.linspace(900, 900 + r, 40)
+        )
+        for r in (200.0, 300.0, 400.0)
+    ]
@@ -1,5 +1,3 @@
-import os
-
 from ogum.config import Settings
 
 
@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+
+from ogum import core
+
+
+def test_sigmoids_match_numpy_fallback(monkeypatch):
+    x = np.linspace(-50, 50, 201)
+    fast_b = core.boltzmann_sigmoid(x, 1.0, 5.0, 3.0, 2.0)
+    fast_g = core.generalized_logistic_stable(x, 1.0, 5.0, 3.0, 2.0, 0.7)
+    monkeypatch.setattr(core, "HAS_NUMBA", False)
+    np.testing.assert_allclose(fast_b, core.boltzmann_sigmoid(x, 1.0, 5.0, 3.0, 2.0))
+    np.testing.assert_allclose(
+        fast_g, core.generalized_logistic_stable(x, 1.0, 5.0, 3.0, 2.0, 0.7)
+    )
+
+
+def test_data_history_bounded_snapshots():
+    hist = core.DataHistory(maxlen=2)
+    df = pd.DataFrame({"a": [1.0, 2.0]})
+    for name in ("m1", "m2", "m3"):
+        hist.push(df, name)
+    assert [r["module"] for r in hist.get_all()] == ["m2", "m3"]
+    df.loc[0, "a"] = -1.0
+    assert hist.peek()["data"].loc[0, "a"] == 1.0
+    assert hist.pop()["module"] == "m3"
+    assert hist.pop()["module"] == "m2"
+    assert hist.pop() is None
@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ogum import data_refinement
+from ogum.data_refinement import DataRefinement
+
+
+def _mask_reference(df, t_range, d_range):
+    """Boolean-mask filter the window path replaced."""
+    mask = (
+        (df["time"] >= t_range[0])
+        & (df["time"] <= t_range[1])
+        & (df["density"] >= d_range[0])
+        & (df["density"] <= d_range[1])
+    )
+    return df.loc[mask].reset_index(drop=True)
+
+
+def _frame(shuffle):
+    # Repeated time stamps and exact density values sit on the window edges.
+    t = np.repeat(np.arange(0.0, 20.0), 2)
+    df = pd.DataFrame({"time": t, "density": 50.0 + np.arange(t.size)})
+    if shuffle:
+        df = df.sample(frac=1.0, random_state=0).reset_index(drop=True)
+    return df
+
+
+@pytest.mark.parametrize("shuffle", [False, True])
+@pytest.mark.parametrize(
+    "t_range, d_range",
+    [
+        ((0.0, 19.0), (50.0, 89.0)),
+        ((3.0, 11.0), (50.0, 89.0)),
+        ((3.0, 11.0), (60.0, 70.0)),
+        ((4.5, 4.6), (50.0, 89.0)),
+        ((-1.0, 25.0), (61.0, 61.0)),
+    ],
+)
+def test_apply_filters_matches_boolean_mask(shuffle, t_range, d_range):
+    df = _frame(shuffle)
+    ref = DataRefinement(df)
+    assert ref._time_sorted is not shuffle
+    ref.time_slider.value = t_range
+    ref.density_slider.value = d_range
+    pd.testing.assert_frame_equal(
+        ref._apply_filters(), _mask_reference(df, t_range, d_range)
+    )
+
+
+class _FakeTimer:
+    """Timer that only fires when the test advances it."""
+
+    created = []
+
+    def __init__(self, interval, function):
+        self.function = function
+        self.cancelled = False
+        self.started = False
+        _FakeTimer.created.append(self)
+
+    def start(self):
+        self.started = True
+
+    def cancel(self):
+        self.cancelled = True
+
+
+def test_update_debounces_redraw(monkeypatch):
+    _FakeTimer.created = []
+    monkeypatch.setattr(data_refinement.threading, "Timer", _FakeTimer)
+    ref = DataRefinement(_frame(False))
+    redraws = []
+    monkeypatch.setattr(ref, "_redraw", lambda: redraws.append(ref.df_refined))
+
+    for hi in (15.0, 12.0, 9.0, 6.0):
+        ref.time_slider.value = (0.0, hi)
+        ref._update()
+
+    assert len(_FakeTimer.created) == 4
+    assert all(timer.cancelled for timer in _FakeTimer.created[:-1])
+    pending = [timer for timer in _FakeTimer.created if not timer.cancelled]
+    assert len(pending) == 1 and pending[0].started
+    pending[0].function()
+    assert len(redraws) == 1
+    assert redraws[0]["time"].max() == 6.0
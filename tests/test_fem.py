@@ -1,7 +1,81 @@
-from ogum.fem_interface import create_unit_mesh
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+
+from ogum.fem_interface import create_unit_mesh, densify_mesh, densify_mesh_async
+from ogum.sovs import SOVSSolver
+
+
+def _fake_mesh(num_cells):
+    index_map = SimpleNamespace(size_local=num_cells)
+    topology = SimpleNamespace(dim=2, index_map=lambda dim: index_map)
+    return SimpleNamespace(topology=topology)
 
 
 def test_fem_stub():
     mesh = create_unit_mesh(0.5)
     coords = mesh.geometry.x
     assert coords.shape[0] > 2
+
+
+def test_densify_mesh_uniform_history():
+    history = [(0.0, 25.0), (600.0, 800.0), (1200.0, 1200.0)]
+    densities = densify_mesh(_fake_mesh(4), history, Ea=1e5, A=1.0)
+
+    t = np.array([h[0] for h in history])
+    T = np.array([h[1] for h in history]) + 273.15
+    expected = SOVSSolver(Ea=1e5, A=1.0).solve(t, T)[-1]
+    assert densities.shape == (4,)
+    np.testing.assert_allclose(densities, expected)
+
+
+def test_densify_mesh_per_cell_histories():
+    t = np.array([0.0, 600.0, 1200.0])
+    peaks = [900.0, 1100.0, 1300.0]
+    history = np.stack(
+        [np.column_stack([t, [25.0, peak * 0.6, peak]]) for peak in peaks]
+    )
+    densities = densify_mesh(_fake_mesh(3), history, Ea=1e5, A=1.0, max_workers=2)
+
+    expected = [
+        SOVSSolver(Ea=1e5, A=1.0).solve(t, cell[:, 1] + 273.15)[-1]
+        for cell in history
+    ]
+    np.testing.assert_allclose(densities, expected)
+    assert np.all(np.diff(densities) > 0)
+
+
+def test_densify_mesh_async_future_and_callback():
+    history = [(0.0, 25.0), (600.0, 800.0), (1200.0, 1200.0)]
+    received = []
+    done = threading.Event()
+
+    def _callback(result):
+        received.append(result)
+        done.set()
+
+    future = densify_mesh_async(
+        _fake_mesh(2), history, Ea=1e5, A=1.0, callback=_callback
+    )
+    densities = future.result(timeout=30)
+    np.testing.assert_allclose(
+        densities, densify_mesh(_fake_mesh(2), history, Ea=1e5, A=1.0)
+    )
+    assert done.wait(timeout=30)
+    assert received[0]["error"] is None
+
+
+def test_densify_mesh_per_cell_serial_by_default(monkeypatch):
+    import ogum.fem_interface as fem_interface
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("densify_mesh should not start a pool by default")
+
+    monkeypatch.setattr(fem_interface, "ProcessPoolExecutor", _fail)
+    t = np.array([0.0, 600.0, 1200.0])
+    history = np.stack(
+        [np.column_stack([t, [25.0, peak * 0.6, peak]]) for peak in (900.0, 1300.0)]
+    )
+    densities = densify_mesh(_fake_mesh(2), history, Ea=1e5, A=1.0)
+    assert densities.shape == (2,)
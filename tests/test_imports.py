@@ -8,6 +8,7 @@ MODULES = [
     "ogum.sovs",
     "ogum.fem_interface",
     "ogum.processing",
+    "ogum.accel",
     "ogum.mesh_generator",
     "ogum.mesh_generator_ui",
 ]
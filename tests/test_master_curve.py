@@ -1,6 +1,8 @@
 import numpy as np
 import pandas as pd
 
+from ogum import master_curve
+from ogum.core import R
 from ogum.master_curve import build_master_curve
 from ogum.material_calibrator import MaterialCalibrator
 
@@ -26,3 +28,34 @@ def test_build_master_curve_activation_energy():
     ea = result["activation_energy"].iloc[0]
     assert np.isclose(ea, 60.0, rtol=0.3)
 
+
+
+def test_estimate_activation_energy_ramp_matches_polyfit(monkeypatch):
+    t = np.linspace(0, 100, 50)
+    T = np.linspace(800, 1200, 50)
+    k = 5e3 * np.exp(-150e3 / (R * (T + 273.15)))
+    dens = 100 * (1 - np.exp(-k * t))
+    inv_T = 1.0 / (T + 273.15)
+    fast = master_curve._estimate_activation_energy(t, inv_T, dens)
+    monkeypatch.setattr(master_curve, "HAS_NUMBA", False)
+    slow = master_curve._estimate_activation_energy(t, inv_T, dens)
+    assert np.isclose(fast, slow, rtol=1e-9)
+    assert np.isclose(fast, 150.0, rtol=1e-6)
+
+
+def test_build_master_curve_kelvin_input():
+    df = _synthetic()
+    kelvin = df.assign(temperature=df["temperature"] + 273.15)
+    expected = build_master_curve(df)
+    result = build_master_curve(kelvin, temperature_unit="K")
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_ols_slope_intercept_matches_polyfit():
+    rng = np.random.default_rng(0)
+    X = 1.0 / rng.uniform(1000.0, 1500.0, 200)
+    Y = -2e4 * X + 3.0 + rng.normal(0.0, 0.01, 200)
+    np.testing.assert_allclose(
+        master_curve._ols_slope_intercept(X, Y), np.polyfit(X, Y, 1), rtol=1e-9
+    )
+    assert np.isnan(master_curve._ols_slope_intercept(np.full(5, 1e-3), Y[:5])[0])
@@ -35,3 +35,76 @@ def test_predict_matches_observed():
     pred = calib.predict(df)
     assert "predicted_density" in pred.columns
     assert np.allclose(pred["predicted_density"], df["DensidadePct"], rtol=1e-2)
+
+
+def test_arrhenius_seed_recovers_ramp_parameters():
+    t = np.linspace(0, 600, 200)
+    temp = np.linspace(900, 1300, 200)
+    x = MaterialCalibrator._densification(t, temp, 150.0, 5e3)
+    Ea, A = MaterialCalibrator._arrhenius_seed(t, temp + 273.15, x)
+    assert np.isclose(Ea, 150.0, rtol=1e-6)
+    assert np.isclose(A, 5e3, rtol=1e-6)
+
+
+def test_arrhenius_seed_isothermal_is_none():
+    t = np.linspace(0, 10, 50)
+    x = MaterialCalibrator._densification(t, np.full_like(t, 1000.0), 60.0, 2.0)
+    assert MaterialCalibrator._arrhenius_seed(t, np.full_like(t, 1273.15), x) is None
+
+
+def test_fit_exact_ramp_skips_optimizer(monkeypatch):
+    t = np.linspace(0, 600, 200)
+    temp = np.linspace(900, 1300, 200)
+    dens = MaterialCalibrator._densification(t, temp, 150.0, 5e3) * 100.0
+    df = pd.DataFrame({"Time_s": t, "Temperature_C": temp, "DensidadePct": dens})
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("least_squares should not run for exact data")
+
+    monkeypatch.setattr("scipy.optimize.least_squares", _fail)
+    params = MaterialCalibrator().fit(df)
+    assert np.isclose(params["Ea"], 150.0, rtol=1e-6)
+    assert np.isclose(params["A"], 5e3, rtol=1e-6)
+
+
+def test_simulate_synthetic_matches_euler():
+    t = np.linspace(0, 10, 50)
+    df = MaterialCalibrator.simulate_synthetic(60.0, 2.0, t)
+    expected = _generate_data(60.0, 2.0, t)
+    np.testing.assert_allclose(df["DensidadePct"], expected["DensidadePct"], rtol=1e-12)
+
+
+def test_densification_jacobian_matches_finite_differences():
+    t = np.linspace(0, 600, 100)
+    T_k = np.linspace(900, 1300, 100) + 273.15
+    Ea, A = 150.0, 5e3
+    x, jac = MaterialCalibrator._densification_jac(t, T_k, Ea, A)
+    np.testing.assert_allclose(
+        x, MaterialCalibrator._densification_kelvin(t, T_k, Ea, A), rtol=1e-12
+    )
+    for j, (dEa, dA) in enumerate([(1e-4, 0.0), (0.0, 1e-2)]):
+        up = MaterialCalibrator._densification_kelvin(t, T_k, Ea + dEa, A + dA)
+        down = MaterialCalibrator._densification_kelvin(t, T_k, Ea - dEa, A - dA)
+        fd = (up - down) / (2 * (dEa + dA))
+        np.testing.assert_allclose(jac[:, j], fd, rtol=1e-5, atol=1e-12)
+
+
+def test_simulate_synthetic_temperature_ramp():
+    t = np.linspace(0, 600, 100)
+    T = np.linspace(900, 1300, 100)
+    df = MaterialCalibrator.simulate_synthetic(150.0, 5e3, t, T)
+    np.testing.assert_array_equal(df["Temperature_C"], T)
+    np.testing.assert_allclose(
+        df["DensidadePct"],
+        MaterialCalibrator._densification(t, T, 150.0, 5e3) * 100.0,
+        rtol=1e-12,
+    )
+
+
+def test_predict_leaves_input_untouched():
+    df = _generate_data(45.0, 1.5, np.linspace(0, 8, 40))
+    before = df.copy()
+    pred = MaterialCalibrator(Ea=45.0, A=1.5).predict(df)
+    pred.loc[0, "Time_s"] = -1.0
+    pd.testing.assert_frame_equal(df, before)
+    assert list(pred.columns) == [*df.columns, "predicted_density"]
@@ -1,11 +1,16 @@
 import importlib
 import os
+import sys
 import tempfile
+import types
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
+from scipy.spatial.distance import pdist
 
-from ogum.mesh_generator import generate_mesh
+from ogum import mesh_generator
+from ogum.mesh_generator import _sample_centers, generate_mesh
 
 
 def test_generate_mesh_runs_or_errors(tmp_path, monkeypatch):
@@ -24,3 +29,131 @@ def test_generate_mesh_runs_or_errors(tmp_path, monkeypatch):
         assert os.path.isfile(path)
         assert path.endswith(".msh")
         os.remove(path)
+
+
+def test_sample_centers_do_not_overlap():
+    centers = _sample_centers(0.05, 1.0, 50, np.random.default_rng(0))
+    assert centers.shape == (50, 3)
+    assert np.all((centers >= 0.05) & (centers <= 0.95))
+    assert pdist(centers).min() > 0.1
+    again = _sample_centers(0.05, 1.0, 50, np.random.default_rng(0))
+    np.testing.assert_array_equal(centers, again)
+
+
+def test_sample_centers_rejects_impossible_packing():
+    with pytest.raises(ValueError):
+        _sample_centers(0.4, 1.0, 10, np.random.default_rng(0))
+
+
+@pytest.mark.parametrize("n_spheres", [1, 2, 3, 5, 10])
+def test_sample_centers_ui_defaults(n_spheres):
+    # Every MeshGeneratorUI dropdown value at its default radius 1.0, box 5.0.
+    for seed in range(20):
+        centers = _sample_centers(1.0, 5.0, n_spheres, np.random.default_rng(seed))
+        assert centers.shape == (n_spheres, 3)
+        assert np.all((centers > 1.0) & (centers < 4.0))
+        if n_spheres > 1:
+            assert pdist(centers).min() > 2.0
+
+
+def test_lattice_fallback_is_non_overlapping():
+    sites = mesh_generator._lattice_centers(1.0, 5.0)
+    assert len(sites) == 14
+    assert pdist(sites).min() > 2.0
+    assert np.all((sites > 1.0) & (sites < 4.0))
+
+
+def test_mesh_ui_radius_limit_keeps_packings_feasible():
+    from ogum.mesh_generator_ui import MeshGeneratorUI
+
+    ui = MeshGeneratorUI()
+    for box in (1.0, 5.0, 10.0):
+        for n in ui.num_dropdown.options:
+            ui.box_slider.value = box
+            ui.num_dropdown.value = n
+            ui._limit_radius()
+            assert ui.radius_slider.max >= ui.radius_slider.min
+            centers = _sample_centers(
+                ui.radius_slider.max, box, n, np.random.default_rng(0)
+            )
+            assert centers.shape == (n, 3)
+
+
+def test_sample_centers_dense_packing():
+    centers = _sample_centers(0.05, 1.0, 300, np.random.default_rng(0))
+    assert centers.shape == (300, 3)
+    assert pdist(centers).min() > 0.1
+
+
+def test_generate_mesh_fragments_large_packings(monkeypatch):
+    gmsh = types.SimpleNamespace(
+        initialize=Mock(),
+        finalize=Mock(),
+        write=Mock(),
+        option=types.SimpleNamespace(setNumber=Mock()),
+        model=types.SimpleNamespace(
+            add=Mock(),
+            mesh=types.SimpleNamespace(generate=Mock()),
+            occ=types.SimpleNamespace(
+                addBox=Mock(),
+                addSphere=Mock(side_effect=range(2, 100)),
+                cut=Mock(),
+                fragment=Mock(
+                    return_value=(
+                        [],
+                        [[(3, 10), (3, 11), (3, 12)], [(3, 11)], [(3, 12)]],
+                    )
+                ),
+                remove=Mock(),
+                synchronize=Mock(),
+            ),
+        ),
+    )
+    monkeypatch.setitem(sys.modules, "gmsh", gmsh)
+    monkeypatch.setattr(mesh_generator, "FRAGMENT_MIN_SPHERES", 1)
+    path = mesh_generator.generate_mesh(0.05, 1.0, 0.1, 2, seed=0)
+    os.remove(path)
+    gmsh.model.occ.cut.assert_not_called()
+    gmsh.model.occ.fragment.assert_called_once_with([(3, 1)], [(3, 2), (3, 3)])
+    gmsh.model.occ.remove.assert_called_once_with([(3, 11), (3, 12)], recursive=True)
+
+
+def _occ_summary(monkeypatch, gmsh, fragment, n_spheres):
+    """Run ``generate_mesh`` on real gmsh and report the carved geometry."""
+    info = {}
+    real_finalize = gmsh.finalize
+
+    def _finalize():
+        vols = [tag for _, tag in gmsh.model.getEntities(3)]
+        info["volumes"] = {tag: gmsh.model.occ.getMass(3, tag) for tag in vols}
+        info["surfaces"] = len(gmsh.model.getEntities(2))
+        real_finalize()
+
+    monkeypatch.setattr(gmsh, "finalize", _finalize)
+    monkeypatch.setattr(gmsh.model.mesh, "generate", lambda dim: None)
+    monkeypatch.setattr(
+        mesh_generator, "FRAGMENT_MIN_SPHERES", 0 if fragment else 10**9
+    )
+    os.remove(mesh_generator.generate_mesh(0.1, 1.0, 0.5, n_spheres, seed=0))
+    return info
+
+
+def test_generate_mesh_fragment_matches_cut_with_gmsh(monkeypatch):
+    try:
+        gmsh = importlib.import_module("gmsh")
+        gmsh.initialize()
+        gmsh.finalize()
+    except (ImportError, OSError):
+        pytest.skip("gmsh (or its runtime libraries) not available")
+
+    n = 20
+    cut = _occ_summary(monkeypatch, gmsh, False, n)
+    frag = _occ_summary(monkeypatch, gmsh, True, n)
+    # ``cut`` keeps the original box (tag 1) next to the carved volume.
+    carved = [vol for tag, vol in cut["volumes"].items() if tag != 1]
+    assert len(frag["volumes"]) == len(carved) == 1
+    expected = 1.0 - n * 4.0 / 3.0 * np.pi * 0.1**3
+    assert np.isclose(sum(frag["volumes"].values()), carved[0], rtol=1e-9)
+    assert np.isclose(carved[0], expected, rtol=1e-6)
+    # Box faces plus one surface per pore: the shared pore walls survive.
+    assert frag["surfaces"] == cut["surfaces"] == 6 + n
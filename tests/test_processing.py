@@ -1,7 +1,8 @@
+import numpy as np
 import pandas as pd
 import pytest
 
-from ogum.processing import calculate_log_theta
+from ogum.processing import calculate_log_theta, calculate_log_theta_arrays
 
 
 def test_calculate_log_theta_returns_dataframe():
@@ -38,3 +39,62 @@ def test_calculate_log_theta_no_nan():
     result = calculate_log_theta(df, 60)
 
     assert result["logtheta"].isna().sum() == 0
+
+
+def test_calculate_log_theta_arrays_matches_dataframe():
+    t = np.array([0.0, 1.0, 2.0, 3.0])
+    T = np.array([100.0, 110.0, 120.0, 130.0])
+    dens = np.array([10.0, 20.0, 30.0, 40.0])
+    df = pd.DataFrame({"Time_s": t, "Temperature_C": T, "DensidadePct": dens})
+    logtheta, valor, tempo = calculate_log_theta_arrays(t, T, dens, 50.0)
+    expected = calculate_log_theta(df, 50.0)
+    np.testing.assert_allclose(logtheta, expected["logtheta"].to_numpy())
+    np.testing.assert_array_equal(valor, dens)
+    np.testing.assert_array_equal(tempo, t)
+
+
+def test_calculate_log_theta_arrays_matches_scipy_path(monkeypatch):
+    import ogum.processing as processing
+
+    t = np.cumsum(np.linspace(0.5, 2.0, 200))
+    T = np.linspace(25.0, 1300.0, 200)
+    fast, _, _ = calculate_log_theta_arrays(t, T, T, 300.0)
+    monkeypatch.setattr(processing, "HAS_NUMBA", False)
+    slow, _, _ = calculate_log_theta_arrays(t, T, T, 300.0)
+    np.testing.assert_allclose(fast, slow, rtol=1e-12, equal_nan=True)
+
+
+def test_calculate_log_theta_result_does_not_alias_input():
+    df = pd.DataFrame(
+        {
+            "Time_s": [0.0, 1.0, 2.0],
+            "Temperature_C": [100.0, 110.0, 120.0],
+            "DensidadePct": [10.0, 20.0, 30.0],
+        }
+    )
+    result = calculate_log_theta(df, 50.0)
+    result.loc[0, "valor"] = -1.0
+    result.loc[0, "tempo_s"] = -1.0
+    assert df.loc[0, "DensidadePct"] == 10.0
+    assert df.loc[0, "Time_s"] == 0.0
+
+
+def test_calculate_log_theta_accepts_resolved_columns():
+    df = pd.DataFrame(
+        {
+            "Time_s_1": [0.0, 1.0, 2.0],
+            "Temperature_C_1": [100.0, 110.0, 120.0],
+            "DensidadePct_1": [10.0, 20.0, 30.0],
+        }
+    )
+    cols = ("Time_s_1", "Temperature_C_1", "DensidadePct_1")
+    pd.testing.assert_frame_equal(
+        calculate_log_theta(df, 50.0, cols=cols), calculate_log_theta(df, 50.0)
+    )
+
+
+def test_calculate_log_theta_arrays_zero_time_span():
+    t = np.full(5, 3.0)
+    T = np.linspace(100.0, 140.0, 5)
+    logtheta, _, _ = calculate_log_theta_arrays(t, T, T, 50.0)
+    np.testing.assert_array_equal(logtheta, np.log10(np.finfo(float).tiny))
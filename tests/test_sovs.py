@@ -12,3 +12,32 @@ def test_constant_temperature_profile():
     assert x.shape == t.shape
     assert np.all(np.diff(x) > 0)
     assert np.all(x < 1)
+
+
+def test_first_order_ramp_matches_tight_integration():
+    from scipy.integrate import solve_ivp
+
+    from ogum.core import R
+
+    Ea, A = 2e5, 1e4  # x rises from 0.1 to ~0.48 over the ramp
+    solver = SOVSSolver(Ea=Ea, A=A, x0=0.1)
+    t = np.linspace(0, 3600, 50)
+    T = np.linspace(900, 1500, 50)
+
+    # Reference integrates the exact Arrhenius rate along the linear ramp,
+    # so interpolation error of the solver's rate table is caught as well.
+    def rhs(tt, xx):
+        return A * np.exp(-Ea / (R * np.interp(tt, t, T))) * (1 - xx)
+
+    ref = solve_ivp(
+        rhs, (t[0], t[-1]), [0.1], t_eval=t, rtol=1e-10, atol=1e-12
+    ).y[0]
+    np.testing.assert_allclose(solver.solve(t, T), ref, atol=1e-6)
+
+
+def test_nonzero_order_uses_integrator():
+    solver = SOVSSolver(Ea=1e5, A=1.0, x0=0.5, n=1.0)
+    t = np.linspace(0, 10, 11)
+    x = solver.solve(t, np.full_like(t, 1000.0))
+    assert x.shape == t.shape
+    assert np.all(np.diff(x) > 0)
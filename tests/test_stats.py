@@ -39,3 +39,94 @@ def test_generate_report_contents():
     assert "Intervalo Ea" in text
     assert "p-valor Shapiro" in text
     assert "data:image/png;base64" in text
+
+
+def test_bootstrap_ea_process_pool(ramp_experiments):
+    ci_low, ci_high = bootstrap_ea(
+        ramp_experiments, n_bootstrap=8, workers=2, batch=3
+    )
+    assert np.isfinite(ci_low) and np.isfinite(ci_high)
+    assert ci_low <= ci_high
+
+
+def test_bootstrap_ea_single_experiment():
+    t = np.linspace(0, 600, 40)
+    df = MaterialCalibrator.simulate_synthetic(
+        150.0, 5e3, t, np.linspace(900, 1200, 40)
+    )
+    ci_low, ci_high = bootstrap_ea([df], n_bootstrap=50)
+    assert ci_low == ci_high
+    assert np.isclose(ci_low, 150.0, rtol=1e-6)
+
+
+def test_bootstrap_ea_external_executor(ramp_experiments):
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        ci_low, ci_high = bootstrap_ea(
+            ramp_experiments, n_bootstrap=6, batch=2, executor=executor
+        )
+        # The caller keeps ownership: the executor is still usable afterwards.
+        assert executor.submit(int, "1").result() == 1
+    assert np.isfinite(ci_low) and ci_low <= ci_high
+
+
+def test_shapiro_residuals_cached(monkeypatch):
+    rng = np.random.default_rng(2)
+    df = pd.DataFrame({"residual": rng.normal(size=40)})
+    p_val = shapiro_residuals(df)
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("shapiro should not rerun for cached residuals")
+
+    monkeypatch.setattr("scipy.stats.shapiro", _fail)
+    assert shapiro_residuals(df.copy()) == p_val
+
+
+def test_shapiro_residuals_cache_thread_safe():
+    from concurrent.futures import ThreadPoolExecutor
+
+    import ogum.stats as stats
+
+    rng = np.random.default_rng(3)
+    # More distinct inputs than cache slots keeps hits, inserts and
+    # evictions interleaving across threads.
+    frames = [
+        pd.DataFrame({"residual": rng.normal(size=20)})
+        for _ in range(2 * stats._SHAPIRO_CACHE_SIZE)
+    ]
+    expected = [shapiro_residuals(df) for df in frames]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for _ in range(5):
+            assert list(pool.map(shapiro_residuals, frames)) == expected
+    assert len(stats._SHAPIRO_CACHE) <= stats._SHAPIRO_CACHE_SIZE
+
+
+def test_bootstrap_ea_serial_by_default(monkeypatch, ramp_experiments):
+    import ogum.stats as stats
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("bootstrap_ea should not start a pool by default")
+
+    monkeypatch.setattr(stats, "ProcessPoolExecutor", _fail)
+    ci_low, ci_high = bootstrap_ea(ramp_experiments, n_bootstrap=4)
+    assert np.isfinite(ci_low) and ci_low <= ci_high
+
+
+def test_bootstrap_ea_executor_gets_many_tasks(ramp_experiments):
+    from concurrent.futures import Executor, Future
+
+    class CountingExecutor(Executor):
+        def __init__(self):
+            self.submitted = 0
+
+        def submit(self, fn, /, *args, **kwargs):
+            self.submitted += 1
+            future = Future()
+            future.set_result(fn(*args, **kwargs))
+            return future
+
+    executor = CountingExecutor()
+    ci_low, ci_high = bootstrap_ea(ramp_experiments, n_bootstrap=20, executor=executor)
+    assert executor.submitted > 4
+    assert np.isfinite(ci_low) and ci_low <= ci_high
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 from scipy.signal import savgol_filter as scipy_savgol
@@ -47,3 +48,67 @@ def test_savgol_filter_basic():
         }
     )
     pd.testing.assert_frame_equal(result, expected)
+
+
+def test_orlandini_uniform_matches_groupby():
+    t = np.arange(0.0, 95.0, 0.5)
+    df = pd.DataFrame(
+        {
+            "Time_s": t,
+            "Temperature_C": 100 + 2 * t,
+            "DensidadePct": np.sqrt(t),
+        }
+    )
+    filtered = utils.orlandini_araujo_filter(df, bin_size=10)
+    expected = (
+        df.groupby((df["Time_s"] // 10).astype(int)).mean().reset_index(drop=True)
+    )
+    assert len(filtered) == 10
+    pd.testing.assert_frame_equal(filtered, expected)
+
+    # A missing reading is skipped, as groupby does, instead of blanking its bin.
+    df.loc[3, "DensidadePct"] = np.nan
+    df.loc[len(df) - 1, "Temperature_C"] = np.nan
+    filtered = utils.orlandini_araujo_filter(df, bin_size=10)
+    expected = (
+        df.groupby((df["Time_s"] // 10).astype(int)).mean().reset_index(drop=True)
+    )
+    assert not filtered.isna().any().any()
+    pd.testing.assert_frame_equal(filtered, expected)
+
+
+def test_savgol_filter_mixed_columns():
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame(
+        {
+            "label": list("abcdefghij"),
+            "x": rng.normal(size=10),
+            "n": np.arange(10),
+        }
+    )
+    result = utils.savgol_filter(df, window=5, polyorder=2)
+    assert result["label"].tolist() == df["label"].tolist()
+    for col in ("x", "n"):
+        np.testing.assert_allclose(
+            result[col], scipy_savgol(df[col].to_numpy(dtype=float), 5, 2)
+        )
+    assert list(result.columns) == list(df.columns)
+
+
+def test_savgol_filter_keeps_float32_columns():
+    df = pd.DataFrame(
+        {
+            "f32": (np.arange(12, dtype=np.float32) ** 2),
+            "f64": np.linspace(0.0, 1.0, 12),
+            "i": np.arange(12),
+        }
+    )
+    result = utils.savgol_filter(df, window=5, polyorder=2)
+    assert result.dtypes.to_dict() == {
+        "f32": np.dtype(np.float32),
+        "f64": np.dtype(np.float64),
+        "i": np.dtype(np.float64),
+    }
+    np.testing.assert_array_equal(
+        result["f32"], scipy_savgol(df["f32"].to_numpy(), 5, 2)
+    )